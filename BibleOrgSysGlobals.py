@@ -86,6 +86,7 @@ ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), La
 
 debuggingThisModule = False
 haltOnXMLWarning = False # Used for XML debugging
+checkXMLFlag = True # Set to False (with the --trusted command line option) to skip the checkXMLNo… structure checks on already validated XML files
 
 
 import sys, logging, os.path, pickle
@@ -1162,6 +1163,17 @@ def setStrictCheckingFlag( newValue=True ):
 # end of BibleOrgSysGlobals.setStrictCheckingFlag
 
 
+def setCheckXMLFlag( newValue=True ):
+    """
+    Set the flag for checking the structure of XML input files.
+    """
+    global checkXMLFlag
+    checkXMLFlag = newValue
+    if (not checkXMLFlag and verbosityLevel> 2) or verbosityLevel>3:
+        print( '  checkXMLFlag =', checkXMLFlag )
+# end of BibleOrgSysGlobals.setCheckXMLFlag
+
+
 # Some global variables
 BibleBooksCodes = USFMMarkers = USFMParagraphMarkers = internal_SFMs_to_remove = None
 
@@ -1185,6 +1197,7 @@ def addStandardOptionsAndProcess( parserObject, exportAvailable=False ):
     verbosityGroup.add_argument( '-d', '--debug', action='store_true', dest='debug', default=False, help="output even more information for the programmer/debugger" )
     parserObject.add_argument( '-1', '--single', action='store_true', dest='single', default=False, help="don't use multiprocessing (that's the digit one)" )
     parserObject.add_argument( '-c', '--strict', action='store_true', dest='strict', default=False, help="perform very strict checking of all input" )
+    parserObject.add_argument( '--trusted', action='store_true', dest='trusted', default=False, help="skip the XML structure checks on input that's already been validated (ignored with --strict)" )
     if exportAvailable:
         parserObject.add_argument('-x', '--export', action='store_true', dest='export', default=False, help="export the data file(s)")
     commandLineArguments = parserObject.parse_args()
@@ -1199,6 +1212,7 @@ def addStandardOptionsAndProcess( parserObject, exportAvailable=False ):
     elif commandLineArguments.errors: addConsoleLogging( logging.ERROR )
     else: addConsoleLogging( logging.CRITICAL ) # default
     if commandLineArguments.strict: setStrictCheckingFlag()
+    if commandLineArguments.trusted: setCheckXMLFlag( False )
 
     # Determine multiprocessing strategy
     maxProcesses = os.cpu_count()
@@ -1245,6 +1259,7 @@ def printAllGlobals( indent=None ):
     print( "{}verbosityString: {}".format( ' '*indent, verbosityString ) )
     print( "{}verbosityLevel: {}".format( ' '*indent, verbosityLevel ) )
     print( "{}strictCheckingFlag: {}".format( ' '*indent, strictCheckingFlag ) )
+    print( "{}checkXMLFlag: {}".format( ' '*indent, checkXMLFlag ) )
 # end of BibleOrgSysGlobals.printAllGlobals
 
 
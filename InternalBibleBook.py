@@ -1487,9 +1487,8 @@ class InternalBibleBook:
             text = originalText
 
             # Convert USFM markers like s to standard markers like s1
-            try:
-                adjustedMarker = originalMarker if originalMarker in BOS_ADDED_CONTENT_MARKERS else BibleOrgSysGlobals.USFMMarkers.toStandardMarker( originalMarker )
-            except KeyError: # unknown marker
+            adjustedMarker = originalMarker if originalMarker in BOS_ADDED_CONTENT_MARKERS else BibleOrgSysGlobals.USFMMarkers.toStandardMarker( originalMarker, None )
+            if adjustedMarker is None: # unknown marker
                 logging.error( "processLine-check: unknown {} originalMarker = {}".format( self.objectTypeString, originalMarker ) )
                 adjustedMarker = originalMarker # temp……
 
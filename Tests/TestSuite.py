@@ -44,6 +44,7 @@ import ISO_639_3_LanguagesTests, BiblePunctuationSystemsTests
 import BibleBooksNamesTests, BibleVersificationSystemsTests, BibleOrganizationalSystemsTests
 import BibleReferencesTests
 import USFMMarkersTests, USFMFilenamesTests, USXFilenamesTests
+import USXXMLBibleBookTests
 
 
 # Handle command line parameters (for compatibility)
@@ -93,6 +94,8 @@ suiteList.append( unittest.TestLoader().loadTestsFromTestCase( USFMFilenamesTest
 suiteList.append( unittest.TestLoader().loadTestsFromTestCase( USXFilenamesTests.USXFilenamesTests1 ) )
 suiteList.append( unittest.TestLoader().loadTestsFromTestCase( USXFilenamesTests.USXFilenamesTests2 ) )
 
+suiteList.append( unittest.TestLoader().loadTestsFromTestCase( USXXMLBibleBookTests.USXXMLBibleBookTests ) )
+
 
 # Now run all the tests in the suite
 allTests = unittest.TestSuite( suiteList )
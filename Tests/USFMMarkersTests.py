@@ -76,6 +76,29 @@ class USFMMarkersConverterTests( unittest.TestCase ):
         self.assertEqual( self.UMc.pickle(), None ) # Basically just make sure that it runs
     # end of test_1040_pickle
 
+    def test_1045_exportDataToMarshal( self ):
+        """ Test the exportDataToMarshal function. """
+        self.assertEqual( self.UMc.exportDataToMarshal(), None ) # Basically just make sure that it runs
+    # end of test_1045_exportDataToMarshal
+
+    def test_1046_exportDataToMarshalQuietly( self ):
+        """ Test the exportDataToMarshal function as used to cache the tables. """
+        import io, os, marshal, tempfile, contextlib
+        with tempfile.TemporaryDirectory() as folder:
+            filepath = os.path.join( folder, "USFMMarkers_Tables.marshal" )
+            output = io.StringIO()
+            with contextlib.redirect_stdout( output ):
+                self.assertEqual( self.UMc.exportDataToMarshal( filepath, quietFlag=True ), None )
+            self.assertEqual( output.getvalue(), '' ) # Nothing printed
+            self.assertEqual( os.listdir( folder ), ["USFMMarkers_Tables.marshal"] ) # No temporary file left behind
+            with open( filepath, 'rb' ) as marshalFile:
+                formatVersion, XMLFileKey, dataDict = marshal.load( marshalFile )
+            self.assertEqual( formatVersion, USFMMarkersConverter.MARSHAL_FORMAT_VERSION )
+            self.assertEqual( dataDict, self.UMc.importDataToPython() )
+            self.assertRaises( OSError, self.UMc.exportDataToMarshal, os.path.join( folder, "NoSuchFolder", "x.marshal" ), quietFlag=True )
+            self.assertEqual( os.listdir( folder ), ["USFMMarkers_Tables.marshal"] )
+    # end of test_1046_exportDataToMarshalQuietly
+
     def test_1050_exportDataToPython( self ):
         """ Test the exportDataToPython function. """
         self.assertEqual( self.UMc.exportDataToPython(), None ) # Basically just make sure that it runs
@@ -90,6 +113,11 @@ class USFMMarkersConverterTests( unittest.TestCase ):
         """ Test the exportDataToC function. """
         self.assertEqual( self.UMc.exportDataToC(), None ) # Basically just make sure that it runs
     # end of test_1070_exportDataToC
+
+    def test_1075_exportMarkerFlagsToC( self ):
+        """ Test the exportMarkerFlagsToC function. """
+        self.assertEqual( self.UMc.exportMarkerFlagsToC(), None ) # Basically just make sure that it runs
+    # end of test_1075_exportMarkerFlagsToC
 # end of USFMMarkersConverterTests class
 
 
@@ -226,6 +254,37 @@ class USFMMarkersTests( unittest.TestCase ):
             self.assertFalse( self.UMs.isPrinted(badMarker) )
     # end of test_2090_isPrinted
 
+    def test_2095_classifyMarkers( self ):
+        """ Test the classifyMarkers function. """
+        markers = ( 'id', 'p', 'q', 'q1', 'f', 'ft', 'em', 'pr', 'H', 'q5', '\\p', )
+        results = self.UMs.classifyMarkers( markers )
+        self.assertEqual( len(results), len(markers) )
+        for marker,flags in zip( markers, results ):
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_VALID_FLAG), self.UMs.isValidMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_NEWLINE_FLAG), self.UMs.isNewlineMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_INTERNAL_FLAG), self.UMs.isInternalMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_NOTE_FLAG), self.UMs.isNoteMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_COMPULSORY_FLAG), self.UMs.isCompulsoryMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_NUMBERABLE_FLAG), self.UMs.isNumberableMarker(marker) )
+            self.assertEqual( bool(flags & USFMMarkers.MARKER_DEPRECATED_FLAG), self.UMs.isDeprecatedMarker(marker) )
+        for badMarker in ( 'H', 'q5', '\\p', ):
+            self.assertEqual( self.UMs.classifyMarkers( [badMarker] ), [0] )
+        self.assertEqual( self.UMs.classifyMarkers( [] ), [] )
+    # end of test_2095_classifyMarkers
+
+    def test_2097_classifyMarkerID( self ):
+        """ Test the getMarkerID and classifyMarkerID functions. """
+        markers = ( 'id', 'p', 'q', 'q1', 'f', 'ft', 'em', 'pr', )
+        markerIDs = [self.UMs.getMarkerID(marker) for marker in markers]
+        self.assertEqual( len(set(markerIDs)), len(markers) )
+        for markerID in markerIDs:
+            self.assertTrue( markerID > 0 )
+        self.assertEqual( [self.UMs.classifyMarkerID(markerID) for markerID in markerIDs], self.UMs.classifyMarkers(markers) )
+        for badMarker in ( 'H', 'y', 'Q1', 'q5', 'x*', '\\p', ):
+            self.assertEqual( self.UMs.getMarkerID(badMarker), 0 )
+        self.assertEqual( self.UMs.classifyMarkerID(0), 0 )
+    # end of test_2097_classifyMarkerID
+
     def test_2100_markerShouldBeClosed( self ):
         """ Test the markerShouldBeClosed function. """
         for simpleMarker in ( 'f', 'ft', 'x', 'xq', 'em', 'wj', 'ndx', ):
@@ -276,6 +335,18 @@ class USFMMarkersTests( unittest.TestCase ):
             self.assertRaises( KeyError, self.UMs.toStandardMarker, badMarker )
     # end of test_2120_toStandardMarker
 
+    def test_2125_toStandardMarkerDefault( self ):
+        """ Test the toStandardMarker function with a default given. """
+        for simpleMarker in ( 'h', 'p', 'c', 'toc1', 'em', ):
+            self.assertEqual( self.UMs.toStandardMarker(simpleMarker, None), simpleMarker )
+        for numberableMarker in ( 'q', 'ili', ):
+            self.assertEqual( self.UMs.toStandardMarker(numberableMarker, None), numberableMarker+'1' )
+        for badMarker in ( 'H', 'y', 'Q1', 'x*', '\\p', ):
+            self.assertEqual( self.UMs.toStandardMarker(badMarker, None), None )
+            self.assertEqual( self.UMs.toStandardMarker(badMarker, badMarker), badMarker )
+            self.assertEqual( self.UMs.toStandardMarker(badMarker, default='p'), 'p' )
+    # end of test_2125_toStandardMarkerDefault
+
     def test_2130_markerOccursIn( self ):
         """ Test the markerOccursIn function. """
         for marker in ( 'h', 's', 'q', 'ili', 'q1', 'q2', 'q3', 's1', 'ili1', 'ili2', 'ili3', 'p', 'b', 'toc1', 'f', 'ft', 'x', 'xq', 'em', ):
@@ -306,6 +377,17 @@ class USFMMarkersTests( unittest.TestCase ):
             self.assertRaises( KeyError, self.UMs.getMarkerDescription, badMarker )
     # end of test_2150_getMarkerDescription
 
+    def test_2155_getMarkerInfo( self ):
+        """ Test the getMarkerInfo function. """
+        for marker in ( 'h', 'p', 'c', 'b', 'v', 'toc1', 'em', 'q', 'q1', 's1', 'ili', 'f', 'xq', ):
+            result = self.UMs.getMarkerInfo( marker )
+            self.assertTrue( isinstance( result, tuple ) )
+            self.assertEqual( result, ( self.UMs.getMarkerEnglishName(marker), self.UMs.getMarkerDescription(marker),
+                                        self.UMs.isCompulsoryMarker(marker), self.UMs.isNumberableMarker(marker), self.UMs.markerOccursIn(marker), ) )
+        for badMarker in ( 'H', 'y', 'Q1', 'q5', 'x*', '\\p', ):
+            self.assertEqual( self.UMs.getMarkerInfo(badMarker), None )
+    # end of test_2155_getMarkerInfo
+
     def test_2160_getOccursInList( self ):
         """ Test the getOccursInList function. """
         result = self.UMs.getOccursInList()
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# USXXMLBibleBookTests.py
+#   Last modified: 2017-05-01 (also update ProgVersion below)
+#
+# Module testing USXXMLBibleBook.py
+#
+# Copyright (C) 2017 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing USXXMLBibleBook.py.
+"""
+
+ProgName = "USX XML Bible book tests"
+ProgVersion = '0.01'
+ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
+
+
+import sys, os, tempfile, unittest
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import BibleOrgSysGlobals, USXXMLBibleBook
+
+
+class USXXMLBibleBookTests( unittest.TestCase ):
+    """ Unit tests for loading a USXXMLBibleBook object. """
+
+    def setUp( self ):
+        self.testFolder = 'Tests/DataFilesForTests/USXTest1/' # This is a RELATIVE path
+        self.testFilename = '0532TH.usx'
+
+    def test_010_load( self ):
+        """ Test loading a good USX file. """
+        UxBB = USXXMLBibleBook.USXXMLBibleBook( 'Test', 'TH2' )
+        UxBB.load( self.testFilename, self.testFolder )
+        self.assertGreater( len(UxBB._rawLines), 50 )
+        self.assertEqual( UxBB._rawLines[0][0], 'id' )
+        self.assertFalse( 'Load Errors' in UxBB.errorDictionary )
+    # end of test_010_load
+
+    def test_020_loadMalformed( self ):
+        """ Test that a malformed (here truncated) USX file doesn't leave part of a book loaded. """
+        with open( os.path.join( self.testFolder, self.testFilename ), 'rb' ) as goodFile:
+            goodData = goodFile.read()
+        with tempfile.TemporaryDirectory() as folder:
+            with open( os.path.join( folder, self.testFilename ), 'wb' ) as badFile:
+                badFile.write( goodData[:len(goodData)//2] ) # Chop it off in the middle
+            UxBB = USXXMLBibleBook.USXXMLBibleBook( 'Test', 'TH2' )
+            UxBB.load( self.testFilename, folder )
+        self.assertEqual( UxBB._rawLines, [] )
+        self.assertTrue( 'Load Errors' in UxBB.errorDictionary )
+        self.assertEqual( len(UxBB.errorDictionary['Load Errors']), 1 )
+        self.assertTrue( 'parse error' in UxBB.errorDictionary['Load Errors'][0] )
+    # end of test_020_loadMalformed
+# end of USXXMLBibleBookTests class
+
+
+if __name__ == '__main__':
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    if BibleOrgSysGlobals.verbosityLevel > 1: print( ProgNameVersion )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of USXXMLBibleBookTests.py
@@ -30,6 +30,7 @@ See http://paratext.org/about/usfm
 Contains functions:
     removeUSFMCharacterField( marker, originalText, closedFlag )
     replaceUSFMCharacterFields( replacements, originalText )
+    makeMarkerFlagsDict( dataDict )
 
 Contains the singleton class: USFMMarkers
 """
@@ -46,7 +47,7 @@ ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), La
 debuggingThisModule = False
 
 
-import os, logging
+import os, sys, logging
 from collections import OrderedDict
 
 from singleton import singleton
@@ -267,47 +268,206 @@ for thisSet in footnoteSets: assert footnoteSets.count(thisSet) == 1 # Check the
 for thisSet in xrefSets: assert xrefSets.count(thisSet) == 1
 
 
+# Bit flags returned by USFMMarkers.classifyMarkers
+MARKER_VALID_FLAG = 0x01
+MARKER_NEWLINE_FLAG = 0x02
+MARKER_INTERNAL_FLAG = 0x04
+MARKER_NOTE_FLAG = 0x08
+MARKER_COMPULSORY_FLAG = 0x10
+MARKER_NUMBERABLE_FLAG = 0x20
+MARKER_DEPRECATED_FLAG = 0x40
+MARKER_FLAG_NAMES = ( 'VALID', 'NEWLINE', 'INTERNAL', 'NOTE', 'COMPULSORY', 'NUMBERABLE', 'DEPRECATED', )
+
+_NO_DEFAULT = object() # Sentinel so that callers can give None as a default
+
+
+def makeMarkerFlagsDict( dataDict ):
+    """
+    Given the dictionaries made by USFMMarkersConverter.importDataToPython,
+        returns a dictionary mapping every marker (e.g., both q and q1) to its MARKER_…_FLAG bits.
+    """
+    rawMarkerDict = dataDict['rawMarkerDict']
+    newlineMarkersSet = frozenset( dataDict['combinedNewlineMarkersList'] )
+    internalMarkersSet = frozenset( dataDict['internalMarkersList'] )
+    noteMarkersSet = frozenset( dataDict['noteMarkersList'] )
+    deprecatedMarkersSet = frozenset( dataDict['deprecatedMarkersList'] )
+
+    markerFlags = {}
+    for marker,rawMarker in dataDict['combinedMarkerDict'].items():
+        rawMarkerEntry = rawMarkerDict[rawMarker]
+        flags = MARKER_VALID_FLAG
+        if marker in newlineMarkersSet: flags |= MARKER_NEWLINE_FLAG
+        if rawMarker in internalMarkersSet: flags |= MARKER_INTERNAL_FLAG
+        if rawMarker in noteMarkersSet: flags |= MARKER_NOTE_FLAG
+        if rawMarkerEntry['compulsoryFlag']: flags |= MARKER_COMPULSORY_FLAG
+        if rawMarkerEntry['numberableFlag']: flags |= MARKER_NUMBERABLE_FLAG
+        if marker in deprecatedMarkersSet: flags |= MARKER_DEPRECATED_FLAG
+        markerFlags[marker] = flags
+    return markerFlags
+# end of makeMarkerFlagsDict
+
+
 
 @singleton # Can only ever have one instance
 class USFMMarkers:
     """
     Class for handling USFMMarkers.
     This class doesn't deal at all with XML, only with Python dictionaries, etc.
+
+    NOTE: BibleOrgSysGlobals.USFMMarkers is the already loaded instance,
+        so it's best to use that (or a local reference to it) rather than calling USFMMarkers() each time.
     """
+    # These lookup tables are only made when first used (by __getattr__)
+    _derivedTableNames = frozenset( ( '_newlineMarkersSet', '_internalMarkersSet', '_noteMarkersSet', '_deprecatedMarkersSet',
+                                    '_compulsorySet', '_numberableSet', '_nestingSet', '_printedSet',
+                                    '_occursInMap', '_englishNameMap', '_descriptionMap', '_standardMarkerMap', '_markerFlags',
+                                    '_markerIDs', '_markerFlagsTable', '_markerInfoMap', ) )
+    # No per-instance __dict__ (and no name-mangling) so attribute access is as direct as possible
+    __slots__ = ( '_dataDict', '_combinedMarkerDict', '_rawMarkerDict', '_conversionDict', ) + tuple( sorted( _derivedTableNames ) )
 
     def __init__( self ): # We can't give this parameters because of the singleton
         """
         Constructor:
         """
-        self.__DataDict = None # We'll import into this in loadData
+        self._dataDict = None # We'll import into this in loadData
+        # The most used of the above dicts are also bound directly to attributes (in loadData)
+        self._combinedMarkerDict = self._rawMarkerDict = self._conversionDict = None
+        # NOTE: The sets and dicts derived from the above (named in _derivedTableNames) are deliberately not set here
+        #   so that __getattr__ can make them when they're first used
     # end of USFMMarkers.__init__
 
 
     def loadData( self, XMLFilepath=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
-        if not self.__DataDict: # We need to load them once -- don't do this unnecessarily
-            # See if we can load from the pickle file (faster than loading from the XML)
+        if not self._dataDict: # We need to load them once -- don't do this unnecessarily
+            # See if we can load from the marshal or pickle file (faster than loading from the XML)
             dataFilepath = os.path.join( os.path.dirname(__file__), "DataFiles/" )
             standardXMLFilepath = os.path.join( dataFilepath, "USFMMarkers.xml" )
+            standardMarshalFilepath = os.path.join( dataFilepath, "DerivedFiles", "USFMMarkers_Tables.marshal" )
             standardPickleFilepath = os.path.join( dataFilepath, "DerivedFiles", "USFMMarkers_Tables.pickle" )
             if XMLFilepath is None \
+            and os.access( standardMarshalFilepath, os.R_OK ): # There's a marshal file (which knows which XML file it was made from)
+                import marshal
+                from USFMMarkersConverter import MARSHAL_FORMAT_VERSION, getXMLFileKey
+                if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading marshal file {}…".format( standardMarshalFilepath ) )
+                try:
+                    with open( standardMarshalFilepath, 'rb') as marshalFile:
+                        formatVersion, XMLFileKey, dataDict = marshal.load( marshalFile )
+                    if formatVersion == MARSHAL_FORMAT_VERSION and tuple(XMLFileKey) == getXMLFileKey( standardXMLFilepath ):
+                        self._dataDict = dataDict
+                    else: logging.info( "Ignoring out-of-date marshal file {}".format( standardMarshalFilepath ) )
+                except (EOFError, ValueError, TypeError) as err: # includes the wrong number of values to unpack
+                    logging.warning( "Unable to load marshal file {}: {}".format( standardMarshalFilepath, err ) )
+            if self._dataDict: pass # Already loaded from the marshal file above
+            elif XMLFilepath is None \
             and os.access( standardPickleFilepath, os.R_OK ) \
             and os.stat(standardPickleFilepath)[8] > os.stat(standardXMLFilepath)[8] \
             and os.stat(standardPickleFilepath)[9] > os.stat(standardXMLFilepath)[9]: # There's a newer pickle file
                 import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self._dataDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
             else: # We have to load the XML (much slower)
                 from USFMMarkersConverter import USFMMarkersConverter
                 if XMLFilepath is not None: logging.warning( _("USFM markers are already loaded -- your given filepath of {!r} was ignored").format(XMLFilepath) )
                 umc = USFMMarkersConverter()
                 umc.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
-                self.__DataDict = umc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                self._dataDict = umc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                if XMLFilepath is None: # Cache the tables so that next time we can load them quickly
+                    try: umc.exportDataToMarshal( standardMarshalFilepath, quietFlag=True )
+                    except OSError as err: logging.info( "Unable to cache USFM markers in {}: {}".format( standardMarshalFilepath, err ) )
+            self.__internMarkers()
+            self.__bindDataDicts()
         return self
     # end of USFMMarkers.loadData
 
 
+    def __internMarkers( self ):
+        """
+        Interns the marker strings in the loaded tables
+            so that the many lookups with (interned) literal markers like 'p' can match on identity.
+        """
+        intern = sys.intern
+        for dataName,data in self._dataDict.items():
+            if isinstance( data, dict ):
+                self._dataDict[dataName] = { intern(key):intern(value) if isinstance( value, str ) else value
+                                                for key,value in data.items() }
+            elif isinstance( data, list ):
+                self._dataDict[dataName] = [intern(marker) for marker in data]
+    # end of USFMMarkers.__internMarkers
+
+
+    def __bindDataDicts( self ):
+        """
+        Binds the most used dictionaries directly to attributes
+            to save the dict-of-dicts lookup in every call.
+
+        The other lookup tables are only made when first used (see __getattr__).
+        """
+        self._combinedMarkerDict = self._dataDict['combinedMarkerDict']
+        self._rawMarkerDict = self._dataDict['rawMarkerDict']
+        self._conversionDict = self._dataDict['conversionDict']
+    # end of USFMMarkers.__bindDataDicts
+
+
+    def __getattr__( self, name ):
+        """
+        Only called if the attribute isn't found in the usual places,
+            so we use it to make the derived lookup tables the first time they're needed.
+
+        (Most programs only use a few of the is… and get… functions.)
+        """
+        if name not in self._derivedTableNames: # NOTE: USFMMarkers is a function here (because of the singleton decorator)
+            raise AttributeError( "{!r} object has no attribute {!r}".format( type(self).__name__, name ) )
+        table = self.__makeDerivedTable( name )
+        setattr( self, name, table ) # So we don't get called again for this name
+        return table
+    # end of USFMMarkers.__getattr__
+
+
+    def __makeDerivedTable( self, tableName ):
+        """
+        Makes one set or dict from the loaded data so that the various is… and get… functions
+            can answer with a single lookup (rather than going via toRawMarker and rawMarkerDict).
+
+        These are all keyed by every valid marker, i.e., both q and q1.
+        """
+        assert self._dataDict, "USFMMarkers.loadData() must be called first"
+        if tableName == '_newlineMarkersSet': return frozenset( self._dataDict['combinedNewlineMarkersList'] )
+        if tableName == '_deprecatedMarkersSet': return frozenset( self._dataDict['deprecatedMarkersList'] )
+        if tableName == '_markerFlags': return makeMarkerFlagsDict( self._dataDict )
+        if tableName == '_markerIDs': return { m:markerID for markerID,m in enumerate( self._combinedMarkerDict, start=1 ) } # 0 is for invalid markers
+        if tableName == '_markerFlagsTable': # A byte of flags for each marker ID (in the same order as _markerIDs)
+            markerFlags = self._markerFlags
+            return bytes( [0] + [markerFlags[m] for m in self._markerIDs] )
+        if tableName == '_standardMarkerMap':
+            standardMarkerMap = { m:m for m in self._combinedMarkerDict }
+            standardMarkerMap.update( self._conversionDict )
+            return standardMarkerMap
+
+        rawMarkerDict = self._rawMarkerDict
+        combinedMarkerItems = self._combinedMarkerDict.items()
+        if tableName == '_internalMarkersSet':
+            internalMarkers = frozenset( self._dataDict['internalMarkersList'] ) # Raw markers
+            return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarker in internalMarkers )
+        if tableName == '_noteMarkersSet':
+            noteMarkers = frozenset( self._dataDict['noteMarkersList'] ) # Raw markers
+            return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarker in noteMarkers )
+        if tableName == '_compulsorySet': return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarkerDict[rawMarker]['compulsoryFlag'] )
+        if tableName == '_numberableSet': return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarkerDict[rawMarker]['numberableFlag'] )
+        if tableName == '_nestingSet': return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarkerDict[rawMarker]['nestsFlag'] )
+        if tableName == '_printedSet': return frozenset( m for m,rawMarker in combinedMarkerItems if rawMarkerDict[rawMarker]['printedFlag'] )
+        if tableName == '_occursInMap': return { m:rawMarkerDict[rawMarker]['occursIn'] for m,rawMarker in combinedMarkerItems }
+        if tableName == '_englishNameMap': return { m:rawMarkerDict[rawMarker]['nameEnglish'] for m,rawMarker in combinedMarkerItems }
+        if tableName == '_markerInfoMap':
+            return { m:(rawMarkerDict[rawMarker]['nameEnglish'], rawMarkerDict[rawMarker]['description'],
+                        rawMarkerDict[rawMarker]['compulsoryFlag'], rawMarkerDict[rawMarker]['numberableFlag'], rawMarkerDict[rawMarker]['occursIn'])
+                                for m,rawMarker in combinedMarkerItems }
+        if tableName == '_descriptionMap': return { m:rawMarkerDict[rawMarker]['description'] for m,rawMarker in combinedMarkerItems }
+        raise KeyError( tableName )
+    # end of USFMMarkers.__makeDerivedTable
+
+
     def __str__( self ):
         """
         This method returns the string representation of the USFM markers object.
@@ -315,90 +475,115 @@ class USFMMarkers:
         @return: the name of a USFM markers object formatted as a string
         @rtype: string
         """
-        indent = 2
-        result = "USFM Markers object"
-        result += ('\n' if result else '') + ' '*indent + _("Number of entries = {}").format( len(self.__DataDict['rawMarkerDict']) )
+        resultLines = [ "USFM Markers object",
+                        '  ' + _("Number of entries = {}").format( len(self._rawMarkerDict) ) ]
         if BibleOrgSysGlobals.verbosityLevel > 2:
-            indent = 4
-            result += ('\n' if result else '') + ' '*indent + _("Number of raw new line markers = {}").format( len(self.__DataDict['newlineMarkersList']) )
-            result += ('\n' if result else '') + ' '*indent + _("Number of internal markers = {}").format( len(self.__DataDict["internalMarkersList"]) )
-            result += ('\n' if result else '') + ' '*indent + _("Number of note markers = {}").format( len(self.__DataDict["noteMarkersList"]) )
-        return result
+            resultLines.append( '    ' + _("Number of raw new line markers = {}").format( len(self._dataDict['newlineMarkersList']) ) )
+            resultLines.append( '    ' + _("Number of internal markers = {}").format( len(self._dataDict["internalMarkersList"]) ) )
+            resultLines.append( '    ' + _("Number of note markers = {}").format( len(self._dataDict["noteMarkersList"]) ) )
+        return '\n'.join( resultLines )
     # end of USFMMarkers.__str__
 
 
     def __len__( self ):
         """ Return the number of available markers. """
-        return len(self.__DataDict['combinedMarkerDict'])
+        return len(self._combinedMarkerDict)
 
 
     def __contains__( self, marker ):
         """ Returns True or False. """
-        return marker in self.__DataDict['combinedMarkerDict']
+        return marker in self._combinedMarkerDict
 
 
     def __getitem__( self, keyIndex ):
         """ Returns a marker according to an integer index. """
-        return self.__DataDict["numberedMarkerList"][keyIndex]
+        return self._dataDict["numberedMarkerList"][keyIndex]
 
 
     def isValidMarker( self, marker ):
         """ Returns True or False. """
-        return marker in self.__DataDict['combinedMarkerDict']
+        return marker in self._combinedMarkerDict
 
 
     def isNewlineMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.toRawMarker(marker) in self.__DataDict['combinedNewlineMarkersList']
+        return marker in self._newlineMarkersSet
 
 
     def isInternalMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.toRawMarker(marker) in self.__DataDict["internalMarkersList"]
+        return marker in self._internalMarkersSet
 
 
     def isNoteMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.toRawMarker(marker) in self.__DataDict["noteMarkersList"]
+        return marker in self._noteMarkersSet
 
 
     def isDeprecatedMarker( self, marker ):
         """ Return True or False. """
-        return marker in self.__DataDict["deprecatedMarkersList"]
+        return marker in self._deprecatedMarkersSet
 
 
     def isCompulsoryMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["compulsoryFlag"]
+        return marker in self._compulsorySet
 
 
     def isNumberableMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["numberableFlag"]
+        return marker in self._numberableSet
 
 
     def isNestingMarker( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["nestsFlag"]
+        return marker in self._nestingSet
 
 
     def isPrinted( self, marker ):
         """ Return True or False. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["printedFlag"]
+        return marker in self._printedSet
+
+
+    def classifyMarkers( self, markers ):
+        """
+        Given an iterable of markers (without backslashes), e.g., from a whole book,
+            returns a list of integers made from the MARKER_…_FLAG bits for each marker.
+
+        Invalid markers give 0.
+
+        This is much faster than calling several of the is… functions for each marker.
+        """
+        getFlags = self._markerFlags.get
+        return [getFlags( marker, 0 ) for marker in markers]
+    # end of USFMMarkers.classifyMarkers
+
+
+    def getMarkerID( self, marker ):
+        """
+        Returns a small integer ID for the marker (for use with classifyMarkerID),
+            or 0 for an invalid marker.
+        """
+        return self._markerIDs.get( marker, 0 )
+    # end of USFMMarkers.getMarkerID
+
+
+    def classifyMarkerID( self, markerID ):
+        """
+        Given an ID from getMarkerID, returns the MARKER_…_FLAG bits for that marker
+            with a single index into a table of bytes.
+
+        Useful for callers that store marker IDs rather than marker strings.
+        """
+        return self._markerFlagsTable[markerID]
+    # end of USFMMarkers.classifyMarkerID
 
 
     def markerShouldBeClosed( self, marker ):
         """ Return 'N', 'S', 'A' for "never", "sometimes", "always".
             Returns False for an invalid marker. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        closed = self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["closed"]
+        if marker not in self._combinedMarkerDict: return False
+        closed = self._rawMarkerDict[self._combinedMarkerDict[marker]]["closed"]
         #if closed is None: return 'N'
         if closed == "No": return 'N'
         if closed == "Always": return 'A'
@@ -411,8 +596,8 @@ class USFMMarkers:
     def markerShouldHaveContent( self, marker ):
         """ Return "N", "S", "A" for "never", "sometimes", "always".
             Returns False for an invalid marker. """
-        if marker not in self.__DataDict['combinedMarkerDict']: return False
-        hasContent = self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["hasContent"]
+        if marker not in self._combinedMarkerDict: return False
+        hasContent = self._rawMarkerDict[self._combinedMarkerDict[marker]]["hasContent"]
         #if hasContent is None: return "N"
         if hasContent == "Never": return "N"
         if hasContent == "Always": return "A"
@@ -424,40 +609,52 @@ class USFMMarkers:
 
     def toRawMarker( self, marker ):
         """ Returns a marker without numerical suffixes, i.e., s1->s, q1->q, etc. """
-        return self.__DataDict['combinedMarkerDict'][marker]
+        return self._combinedMarkerDict[marker]
 
 
-    def toStandardMarker( self, marker ):
-        """ Returns a standard marker, i.e., s->s1, q->q1, etc. """
-        if marker in self.__DataDict['conversionDict']: return self.__DataDict['conversionDict'][marker]
-        #else
-        if marker in self.__DataDict['combinedMarkerDict']: return marker
-        #else must be something wrong
-        raise KeyError
+    def toStandardMarker( self, marker, default=_NO_DEFAULT ):
+        """ Returns a standard marker, i.e., s->s1, q->q1, etc.
+            Returns the default for an invalid marker if one is given,
+                otherwise raises a KeyError. """
+        standardMarker = self._standardMarkerMap.get( marker, default )
+        if standardMarker is _NO_DEFAULT: raise KeyError( marker )
+        return standardMarker
     # end of USFMMarkers.toStandardMarker
 
 
     def markerOccursIn( self, marker ):
         """ Return a short string, e.g. "Introduction", "Text". """
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["occursIn"]
+        return self._occursInMap[marker]
 
 
     def getMarkerEnglishName( self, marker ):
         """ Returns the English name for a marker.
                 Use getOccursInList() to get a list of all possibilities. """
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["nameEnglish"]
+        return self._englishNameMap[marker]
 
 
     def getMarkerDescription( self, marker ):
         """ Returns the description for a marker (or None). """
-        return self.__DataDict['rawMarkerDict'][self.toRawMarker(marker)]["description"]
+        return self._descriptionMap[marker]
+
+
+    def getMarkerInfo( self, marker ):
+        """
+        Returns a 5-tuple for the marker containing:
+            English name, description, compulsory flag, numberable flag, occurs in (as returned by markerOccursIn)
+        or None for an invalid marker.
+
+        This saves several separate calls if more than one of these is wanted.
+        """
+        return self._markerInfoMap.get( marker )
+    # end of USFMMarkers.getMarkerInfo
 
 
     def getOccursInList( self ):
         """ Returns a list of strings which markerOccursIn can return. """
         oiList = []
-        for marker in self.__DataDict['rawMarkerDict']:
-            occursIn = self.__DataDict['rawMarkerDict'][marker]['occursIn']
+        for markerEntry in self._rawMarkerDict.values():
+            occursIn = markerEntry['occursIn']
             if occursIn not in oiList: oiList.append( occursIn )
         return oiList
     # end of USFMMarkers.getOccursInList
@@ -472,11 +669,11 @@ class USFMMarkers:
             'CanonicalText'
         """
         assert option in ('Raw','Numbered','Combined','CanonicalText')
-        if option=='Combined': return self.__DataDict['combinedNewlineMarkersList'] # Includes q, q1, q2, …
-        elif option=='Raw': return self.__DataDict['newlineMarkersList'] # Doesn't include q1, q2, …
-        elif option=='Numbered': return self.__DataDict['numberedNewlineMarkersList'] # Doesn't include q
+        if option=='Combined': return self._dataDict['combinedNewlineMarkersList'] # Includes q, q1, q2, …
+        elif option=='Raw': return self._dataDict['newlineMarkersList'] # Doesn't include q1, q2, …
+        elif option=='Numbered': return self._dataDict['numberedNewlineMarkersList'] # Doesn't include q
         elif option=='CanonicalText':
-            return [m for m in self.__DataDict['numberedNewlineMarkersList'] if self.markerOccursIn(m)=='Canonical Text'] # Doesn't include id, h1, b, q
+            return [m for m in self._dataDict['numberedNewlineMarkersList'] if self.markerOccursIn(m)=='Canonical Text'] # Doesn't include id, h1, b, q
     # end of getNewlineMarkersList
 
 
@@ -485,7 +682,7 @@ class USFMMarkers:
         Returns a list of all possible internal markers.
         This includes character markers, but not footnote and xref markers.
         """
-        return self.__DataDict["internalMarkersList"]
+        return self._dataDict["internalMarkersList"]
     # end of USFMMarkers.getInternalMarkersList
 
 
@@ -498,7 +695,7 @@ class USFMMarkers:
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             print( "getCharacterMarkersList( {}, {}, {}, {} )".format( includeBackslash, includeEndMarkers, includeNestedMarkers, expandNumberableMarkers ) )
         result = []
-        for marker in self.__DataDict["internalMarkersList"]:
+        for marker in self._dataDict["internalMarkersList"]:
             #print( marker, self.markerOccursIn(marker) )
             if self.markerOccursIn(marker) in ("Text","Canonical Text","Poetry","Table row","Introduction",):
                 adjMarker = '\\'+marker if includeBackslash else marker
@@ -527,7 +724,7 @@ class USFMMarkers:
             This includes figure, footnote and xref markers.
             These are fields that should not normally be displayed inline with the text.
         """
-        return self.__DataDict["noteMarkersList"]
+        return self._dataDict["noteMarkersList"]
     # end of USFMMarkers.getNoteMarkersList
 
 
@@ -713,7 +910,7 @@ def demo():
     if BibleOrgSysGlobals.verbosityLevel > 1: print( ProgNameVersion )
 
     # Demo the USFMMarkers object
-    um = USFMMarkers().loadData() # Doesn't reload the XML unnecessarily :)
+    um = BibleOrgSysGlobals.USFMMarkers # Already loaded by BibleOrgSysGlobals.addStandardOptionsAndProcess
     print( um ) # Just print a summary
     print( 'c' in um, 'p' in um, 'tr' in um )
     print( "\nMarkers can occur in", um.getOccursInList() )
@@ -737,14 +934,16 @@ def demo():
 
     nm = um.getNoteMarkersList()
     print( "\nNote markers are", len(nm), nm )
-    for m in ('ab', 'h', 'toc1', 'toc4', 'toc5', 'q', 'q1', 'q2', 'q3', 'q4', 'q5', 'p', 'p1', 'P', 'f', 'f1', 'f*' ):
-        print( _("{} is {}a valid marker").format( m, "" if um.isValidMarker(m) else _("not")+' ' ) )
-        if um.isValidMarker(m):
-            print( '  ' + "{}: {}".format( um.getMarkerEnglishName(m), um.getMarkerDescription(m) ) )
+    testMarkers = ('ab', 'h', 'toc1', 'toc4', 'toc5', 'q', 'q1', 'q2', 'q3', 'q4', 'q5', 'p', 'p1', 'P', 'f', 'f1', 'f*' )
+    for m,markerFlags in zip( testMarkers, um.classifyMarkers( testMarkers ) ): # Classify them all in one call
+        print( _("{} is {}a valid marker").format( m, "" if markerFlags & MARKER_VALID_FLAG else _("not")+' ' ) )
+        if markerFlags & MARKER_VALID_FLAG:
+            nameEnglish, description, compulsoryFlag, numberableFlag, occursIn = um.getMarkerInfo( m )
+            print( '  ' + "{}: {}".format( nameEnglish, description ) )
             if BibleOrgSysGlobals.verbosityLevel > 2:
-                print( '  ' + _("Compulsory:{}, Numberable:{}, Occurs in: {}").format( um.isCompulsoryMarker(m), um.isNumberableMarker(m), um.markerOccursIn(m) ) )
-                print( '  ' + _("{} is {}a new line marker").format( m, "" if um.isNewlineMarker(m) else _("not")+' ' ) )
-                print( '  ' + _("{} is {}an internal (character) marker").format( m, "" if um.isInternalMarker(m) else _("not")+' ' ) )
+                print( '  ' + _("Compulsory:{}, Numberable:{}, Occurs in: {}").format( compulsoryFlag, numberableFlag, occursIn ) )
+                print( '  ' + _("{} is {}a new line marker").format( m, "" if markerFlags & MARKER_NEWLINE_FLAG else _("not")+' ' ) )
+                print( '  ' + _("{} is {}an internal (character) marker").format( m, "" if markerFlags & MARKER_INTERNAL_FLAG else _("not")+' ' ) )
     for text in ('This is a bit of plain text',
                  '\\v 1 This is some \\it italicised\\it* text.',
                  '\\v 2 This \\it is\\it* \\bd more\\bd* complicated.\\f + \\fr 2 \\ft footnote.\\f*',
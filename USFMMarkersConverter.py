@@ -38,15 +38,36 @@ ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), La
 debuggingThisModule = False
 
 
-import logging, os.path
+import logging, os.path, json
 from datetime import datetime
-from collections import OrderedDict
 from xml.etree.ElementTree import ElementTree
 
 from singleton import singleton
 import BibleOrgSysGlobals
 
 
+EXPORT_BUFFER_SIZE = 1 << 20 # Use large write buffers for the exported table files
+NUMBERED_MARKER_SUFFIXES = ( '1', '2', '3', '4', ) # These are the suffix digits that we allow on numberable markers
+MARSHAL_FORMAT_VERSION = 2 # Increment this if the layout of the data tables changes (so old .marshal files get ignored)
+
+def getXMLFileKey( XMLFilepath ):
+    """
+    Returns a key for the current state of the XML file
+        so that a cache made from it can be recognised as up-to-date (or not).
+    """
+    XMLStat = os.stat( XMLFilepath )
+    return ( XMLStat.st_mtime_ns, XMLStat.st_size )
+# end of getXMLFileKey
+
+
+# These are the allowed values for the various marker fields in the XML
+VALID_YES_NO = frozenset( ( 'Yes', 'No', ) )
+VALID_HAS_CONTENT = frozenset( ( 'Always', 'Never', 'Sometimes', ) )
+VALID_CLOSED = frozenset( ( 'No', 'Always', 'Optional', ) )
+VALID_OCCURS_IN = frozenset( ( 'Header', 'Introduction', 'Numbering', 'Text', 'Canonical Text', 'Poetry', 'Text, Poetry',
+                                'Acrostic verse', 'Table row', 'Footnote', 'Cross-reference', 'Front and back matter', ) )
+
+
 
 @singleton # Can only ever have one instance
 class USFMMarkersConverter:
@@ -79,7 +100,9 @@ class USFMMarkersConverter:
 
         # These are fields that we will fill later
         self._XMLheader, self._XMLtree = None, None
+        self._entryCount = 0 # Remembered for after the XML tree is discarded (at the end of importDataToPython)
         self.__DataDicts = {} # Used for import
+        self.__SortedKeys = {} # Sorted keys of the above dictionaries (so each export doesn't have to re-sort them)
         self.titleString = self.ProgVersion = self.dateString = ''
     # end of __init__
 
@@ -88,7 +111,7 @@ class USFMMarkersConverter:
         Loads (and crudely validates the XML file) into an element tree.
             Allows the filepath of the source XML file to be specified, otherwise uses the default.
         """
-        if self._XMLtree is None: # We mustn't have already have loaded the data
+        if self._XMLtree is None and not self.__DataDicts: # We mustn't have already have loaded the data
             if XMLFilepath is None:
                 XMLFilepath = os.path.join( os.path.dirname(__file__), "DataFiles", self._filenameBase + ".xml" ) # Relative to module, not cwd
             self.__load( XMLFilepath )
@@ -149,8 +172,8 @@ class USFMMarkersConverter:
         assert self._XMLtree
 
         uniqueDict = {}
-        for elementName in self._uniqueElements: uniqueDict["Element_"+elementName] = []
-        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = []
+        for elementName in self._uniqueElements: uniqueDict["Element_"+elementName] = set()
+        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = set()
 
         expectedID = 1
         for j,element in enumerate(self._XMLtree):
@@ -185,24 +208,27 @@ class USFMMarkersConverter:
                 for attributeName in self._uniqueAttributes:
                     attributeValue = element.get( attributeName )
                     if attributeValue is not None:
-                        if attributeValue in uniqueDict["Attribute_"+attributeName]:
+                        uniqueBucket = uniqueDict["Attribute_"+attributeName]
+                        if attributeValue in uniqueBucket:
                             logging.error( _("Found {!r} data repeated in {!r} field on {} element in record {}").format( attributeValue, attributeName, element.tag, j ) )
-                        uniqueDict["Attribute_"+attributeName].append( attributeValue )
+                        uniqueBucket.add( attributeValue )
 
                 # Get the marker to use as a record ID
                 marker = element.find("marker").text
 
                 # Check compulsory elements
                 for elementName in self._compulsoryElements:
-                    if element.find( elementName ) is None:
+                    foundElement = element.find( elementName )
+                    if foundElement is None:
                         logging.error( _("Compulsory {!r} element is missing in record with marker {!r} (record {})").format( elementName, marker, j ) )
-                    elif not element.find( elementName ).text:
+                    elif not foundElement.text:
                         logging.warning( _("Compulsory {!r} element is blank in record with marker {!r} (record {})").format( elementName, marker, j ) )
 
                 # Check optional elements
                 for elementName in self._optionalElements:
-                    if element.find( elementName ) is not None:
-                        if not element.find( elementName ).text:
+                    foundElement = element.find( elementName )
+                    if foundElement is not None:
+                        if not foundElement.text:
                             logging.warning( _("Optional {!r} element is blank in record with marker {!r} (record {})").format( elementName, marker, j ) )
 
                 # Check for unexpected additional elements
@@ -212,11 +238,13 @@ class USFMMarkersConverter:
 
                 # Check the elements that must contain unique information (in that particular element -- doesn't check across different elements)
                 for elementName in self._uniqueElements:
-                    if element.find( elementName ) is not None:
-                        text = element.find( elementName ).text
-                        if text in uniqueDict["Element_"+elementName]:
+                    foundElement = element.find( elementName )
+                    if foundElement is not None:
+                        text = foundElement.text
+                        uniqueBucket = uniqueDict["Element_"+elementName]
+                        if text in uniqueBucket:
                             logging.error( _("Found {!r} data repeated in {!r} element in record with marker {!r} (record {})").format( text, elementName, marker, j ) )
-                        uniqueDict["Element_"+elementName].append( text )
+                        uniqueBucket.add( text )
             else:
                 logging.warning( _("Unexpected element: {} in record {}").format( element.tag, j ) )
             if element.tail is not None and element.tail.strip(): logging.error( _("Unexpected {!r} tail data after {} element in record {}").format( element.tail, element.tag, j ) )
@@ -235,72 +263,82 @@ class USFMMarkersConverter:
         if self.titleString: result += ('\n' if result else '') + ' '*indent + _("Title: {}").format( self.titleString )
         if self.ProgVersion: result += ('\n' if result else '') + ' '*indent + _("Version: {}").format( self.ProgVersion )
         if self.dateString: result += ('\n' if result else '') + ' '*indent + _("Date: {}").format( self.dateString )
-        if self._XMLtree is not None: result += ('\n' if result else '') + ' '*indent + _("Number of entries = {}").format( len(self._XMLtree) )
+        if self._XMLtree is not None or self._entryCount: result += ('\n' if result else '') + ' '*indent + _("Number of entries = {}").format( len(self) )
         return result
     # end of __str__
 
     def __len__( self ):
         """ Returns the number of SFM markers loaded. """
-        return len( self._XMLtree )
+        return self._entryCount if self._XMLtree is None else len( self._XMLtree )
     # end of __len__
 
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
-        (Of course, you can just use the elementTree in self._XMLtree if you prefer.)
+
+        The element tree is discarded afterwards (to free the memory) as all further use is via the dictionaries.
+
+        The field values are only checked if BibleOrgSysGlobals.strictCheckingFlag is set
+            (so use strict mode to recheck the XML after editing it).
         """
-        assert self._XMLtree
         if self.__DataDicts: # We've already done an import/restructuring -- no need to repeat it
             return self.__DataDicts
+        assert self._XMLtree
 
         # Load and validate entries and create the dictionaries and lists
         # Note that the combined lists include the numbered markers, e.g., s as well as s1, s2, …
-        rawMarkerDict, numberedMarkerList, combinedMarkerDict, = OrderedDict(), [], {}
+        rawMarkerDict, numberedMarkerList, combinedMarkerDict, = {}, [], {} # NOTE: rawMarkerDict relies on dicts keeping insertion (XML) order
         conversionDict, backConversionDict = {}, {}
         newlineMarkersList, numberedNewlineMarkersList, combinedNewlineMarkersList = [], [], []
         internalMarkersList, numberedInternalMarkersList, combinedInternalMarkersList = [], [], []
         noteMarkersList, deprecatedMarkersList = [], []
+        # Bind these to local names since they're used for every record in the loop below
+        logError = logging.error
+        strictChecking = BibleOrgSysGlobals.strictCheckingFlag
+        numberedMarkerListAppend, deprecatedMarkersListAppend = numberedMarkerList.append, deprecatedMarkersList.append
+        numberedNewlineMarkersListAppend, numberedInternalMarkersListAppend = numberedNewlineMarkersList.append, numberedInternalMarkersList.append
         for element in self._XMLtree:
             # Get the required information out of the tree for this element
             # Start with the compulsory elements
             nameEnglish = element.find('nameEnglish').text # This name is really just a comment element
             marker = element.find('marker').text
-            if marker.lower() != marker:
-                logging.error( _("Marker {!r} should be lower case").format( marker ) )
+            if strictChecking and marker.lower() != marker:
+                logError( _("Marker {!r} should be lower case").format( marker ) )
             compulsory = element.find('compulsory').text
-            if  compulsory not in ( 'Yes', 'No' ): logging.error( _("Unexpected {!r} compulsory field for marker {!r}").format( compulsory, marker ) )
+            if strictChecking and compulsory not in VALID_YES_NO: logError( _("Unexpected {!r} compulsory field for marker {!r}").format( compulsory, marker ) )
             level = element.find('level').text
             compulsoryFlag = compulsory == 'Yes'
             if  level == 'Newline': newlineMarkersList.append( marker ); combinedNewlineMarkersList.append( marker )
             elif level == 'Internal': internalMarkersList.append( marker )
             elif level == 'Note': noteMarkersList.append( marker )
-            else: logging.error( _("Unexpected {!r} level field for marker {!r}").format( level, marker ) )
+            else: logError( _("Unexpected {!r} level field for marker {!r}").format( level, marker ) )
             numberable = element.find('numberable').text
-            if  numberable not in ( 'Yes', 'No' ): logging.error( _("Unexpected {!r} numberable field for marker {!r}").format( numberable, marker ) )
+            if strictChecking and numberable not in VALID_YES_NO: logError( _("Unexpected {!r} numberable field for marker {!r}").format( numberable, marker ) )
             numberableFlag = numberable == "Yes"
-            if numberableFlag and level == "Character": logging.error( _("Unexpected {!r} numberable field for character marker {!r}").format( numberable, marker ) )
+            if strictChecking and numberableFlag and level == "Character": logError( _("Unexpected {!r} numberable field for character marker {!r}").format( numberable, marker ) )
             nests = element.find("nests").text
-            if  nests not in ( 'Yes', 'No' ): logging.error( _("Unexpected {!r} nests field for marker {!r}").format( nests, marker ) )
+            if strictChecking and nests not in VALID_YES_NO: logError( _("Unexpected {!r} nests field for marker {!r}").format( nests, marker ) )
             nestsFlag = nests == 'Yes'
             hasContent = element.find('hasContent').text
-            if  hasContent not in ( 'Always', 'Never', 'Sometimes' ): logging.error( _("Unexpected {!r} hasContent field for marker {!r}").format( hasContent, marker ) )
+            if strictChecking and hasContent not in VALID_HAS_CONTENT: logError( _("Unexpected {!r} hasContent field for marker {!r}").format( hasContent, marker ) )
             printed = element.find('printed').text
-            if  printed not in ( 'Yes', 'No' ): logging.error( _("Unexpected {!r} printed field for marker {!r}").format( printed, marker ) )
+            if strictChecking and printed not in VALID_YES_NO: logError( _("Unexpected {!r} printed field for marker {!r}").format( printed, marker ) )
             printedFlag = printed == 'Yes'
             closed = element.find('closed').text
-            if  closed not in ( 'No', 'Always', 'Optional' ): logging.error( _("Unexpected {!r} closed field for marker {!r}").format( closed, marker ) )
+            if strictChecking and closed not in VALID_CLOSED: logError( _("Unexpected {!r} closed field for marker {!r}").format( closed, marker ) )
             occursIn = element.find('occursIn').text
-            if  occursIn not in ( 'Header', 'Introduction', 'Numbering', 'Text', 'Canonical Text', 'Poetry', 'Text, Poetry', 'Acrostic verse', 'Table row', 'Footnote', 'Cross-reference', 'Front and back matter' ):
-                logging.error( _("Unexpected {!r} occursIn field for marker {!r}").format( occursIn, marker ) )
+            if strictChecking and occursIn not in VALID_OCCURS_IN:
+                logError( _("Unexpected {!r} occursIn field for marker {!r}").format( occursIn, marker ) )
             deprecated = element.find('deprecated').text
-            if  deprecated not in ( 'Yes', 'No' ): logging.error( _("Unexpected {!r} deprecated field for marker {!r}").format( deprecated, marker ) )
+            if strictChecking and deprecated not in VALID_YES_NO: logError( _("Unexpected {!r} deprecated field for marker {!r}").format( deprecated, marker ) )
             deprecatedFlag = deprecated == 'Yes'
 
             # The optional elements are set to None if they don't exist
             #closed = None if element.find("closed") is None else element.find("closed").text
             #if closed is not None and closed not in ( "No", "Always", "Optional" ): logging.error( _("Unexpected {!r} closed field for marker {!r}").format( closed, marker ) )
             #if level=="Character" and closed is None: logging.error( _("Entry for character marker {!r} doesn't have a \"closed\" field").format( marker ) )
-            description = None if element.find("description") is None else element.find("description").text
+            descriptionElement = element.find("description")
+            description = None if descriptionElement is None else descriptionElement.text
             if description is not None: assert description
 
             # Now put it into my dictionaries and lists for easy access
@@ -312,19 +350,18 @@ class USFMMarkersConverter:
             combinedMarkerDict[marker] = marker
             if numberableFlag: # We have some extra work to do
                 conversionDict[marker] = marker + '1'
-                for suffix in '1234': # These are the suffix digits that we allow
-                    numberedMarker = marker + suffix
-                    backConversionDict[numberedMarker] = marker
-                    numberedMarkerList.append( numberedMarker )
-                    combinedMarkerDict[numberedMarker] = marker
-                    if marker in newlineMarkersList: numberedNewlineMarkersList.append( numberedMarker ); combinedNewlineMarkersList.append( numberedMarker )
-                    else: numberedInternalMarkersList.append( numberedMarker ); combinedInternalMarkersList.append( numberedMarker )
-                    if deprecatedFlag: deprecatedMarkersList.append( numberedMarker )
+                numberedMarkers = [marker+suffix for suffix in NUMBERED_MARKER_SUFFIXES]
+                backConversionDict.update( dict.fromkeys( numberedMarkers, marker ) )
+                combinedMarkerDict.update( dict.fromkeys( numberedMarkers, marker ) )
+                numberedMarkerList.extend( numberedMarkers )
+                if level == 'Newline': numberedNewlineMarkersList.extend( numberedMarkers ); combinedNewlineMarkersList.extend( numberedMarkers )
+                else: numberedInternalMarkersList.extend( numberedMarkers ); combinedInternalMarkersList.extend( numberedMarkers )
+                if deprecatedFlag: deprecatedMarkersList.extend( numberedMarkers )
             else: # it's not numberable
-                numberedMarkerList.append( marker )
-                if marker in newlineMarkersList: numberedNewlineMarkersList.append( marker )
-                else: numberedInternalMarkersList.append( marker )
-                if deprecatedFlag: deprecatedMarkersList.append( marker )
+                numberedMarkerListAppend( marker )
+                if level == 'Newline': numberedNewlineMarkersListAppend( marker )
+                else: numberedInternalMarkersListAppend( marker )
+                if deprecatedFlag: deprecatedMarkersListAppend( marker )
 
         #print( conversionDict ); print( backConversionDict )
         #print( "newlineMarkersList", len(newlineMarkersList), newlineMarkersList )
@@ -337,6 +374,9 @@ class USFMMarkersConverter:
                                 "newlineMarkersList":newlineMarkersList, "numberedNewlineMarkersList":numberedNewlineMarkersList, "combinedNewlineMarkersList":combinedNewlineMarkersList,
                                 "internalMarkersList":internalMarkersList, "numberedInternalMarkersList":numberedInternalMarkersList, "combinedInternalMarkersList":combinedInternalMarkersList,
                                 "noteMarkersList":noteMarkersList, "deprecatedMarkersList":deprecatedMarkersList, }
+        self.__SortedKeys = { dictName:sorted(theDict.keys()) for dictName,theDict in self.__DataDicts.items() if isinstance( theDict, dict ) }
+        self._entryCount = len( self._XMLtree )
+        self._XMLtree = None # We don't need the element tree any more
         return self.__DataDicts # Just delete any of the dictionaries that you don't need
     # end of importDataToPython
 
@@ -346,7 +386,6 @@ class USFMMarkersConverter:
         """
         import pickle
 
-        assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
 
@@ -359,6 +398,46 @@ class USFMMarkersConverter:
             pickle.dump( self.__DataDicts, myFile )
     # end of pickle
 
+    def exportDataToMarshal( self, filepath=None, quietFlag=False ):
+        """
+        Writes the information tables to a .marshal file that can be loaded into a Python3 program
+            even faster than the pickle file.
+
+        The tables are saved in a 3-tuple along with MARSHAL_FORMAT_VERSION and the key of the XML file
+            (from getXMLFileKey) so that stale files can be detected.
+        The file is written to a temporary file in the same folder and then renamed into place
+            so that an interrupted write (or another process loading it at the same time) never sees a partial file.
+        If quietFlag is set (as when USFMMarkers caches the tables automatically), nothing is printed.
+        NOTE: marshal only handles the built-in types, so use the pickle file if the tables ever contain anything else.
+        """
+        import marshal, tempfile
+
+        self.importDataToPython()
+        assert self.__DataDicts
+
+        try: marshalledData = marshal.dumps( (MARSHAL_FORMAT_VERSION, getXMLFileKey( self.__XMLFilepath ), self.__DataDicts) )
+        except ValueError as err:
+            ( logging.info if quietFlag else logging.error )( _("Unable to marshal the USFM marker tables: {}").format( err ) )
+            return
+        if not filepath:
+            folder = os.path.join( os.path.split(self.__XMLFilepath)[0], "DerivedFiles/" )
+            if not os.path.exists( folder ): os.mkdir( folder )
+            filepath = os.path.join( folder, self._filenameBase + "_Tables.marshal" )
+        if quietFlag: logging.info( _("Exporting to {}…").format( filepath ) )
+        elif BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
+        fileDescriptor, tempFilepath = tempfile.mkstemp( suffix='.tmp', prefix=os.path.basename( filepath )+'.',
+                                                                dir=os.path.dirname( os.path.abspath( filepath ) ) )
+        try:
+            with open( fileDescriptor, 'wb' ) as myFile:
+                myFile.write( marshalledData )
+            os.chmod( tempFilepath, 0o644 ) # mkstemp makes it private to us
+            os.replace( tempFilepath, filepath )
+        except BaseException:
+            try: os.remove( tempFilepath )
+            except OSError: pass
+            raise
+    # end of exportDataToMarshal
+
     def exportDataToPython( self, filepath=None ):
         """
         Writes the information tables to a .py file that can be cut and pasted into a Python program.
@@ -366,50 +445,50 @@ class USFMMarkersConverter:
         def exportPythonDict( theFile, theDict, dictName, keyComment, fieldsComment ):
             """Exports theDict to theFile."""
             assert isinstance( theDict, dict )
-            for dictKey in theDict.keys(): # Have to iterate this :(
-                fieldsCount = len( theDict[dictKey] ) if isinstance( theDict[dictKey], (tuple,dict,list) ) else 1
-                break # We only check the first (random) entry we get
-            theFile.write( "{} = {{\n  # Key is {}\n  # Fields ({}) are: {}\n".format( dictName, keyComment, fieldsCount, fieldsComment ) )
-            for dictKey in sorted(theDict.keys()):
-                theFile.write( '  {}: {},\n'.format( repr(dictKey), repr(theDict[dictKey]) ) )
-            theFile.write( "}}\n# end of {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            sampleEntry = next( iter( theDict.values() ) ) # We only check the first entry we get
+            fieldsCount = len( sampleEntry ) if isinstance( sampleEntry, (tuple,dict,list) ) else 1
+            parts = [ "{} = {{\n  # Key is {}\n  # Fields ({}) are: {}\n".format( dictName, keyComment, fieldsCount, fieldsComment ) ]
+            for dictKey in self.__SortedKeys.get( dictName ) or sorted(theDict.keys()):
+                parts.append( '  {}: {},\n'.format( repr(dictKey), repr(theDict[dictKey]) ) )
+            parts.append( "}}\n# end of {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            theFile.write( ''.join( parts ) ) # One big write rather than one per entry
         # end of exportPythonDict
 
         def exportPythonOrderedDict( theFile, theDict, dictName, keyComment, fieldsComment ):
-            """Exports theDict to theFile."""
-            assert isinstance( theDict, OrderedDict )
-            for dictKey in theDict.keys(): # Have to iterate this :(
-                fieldsCount = len( theDict[dictKey] ) if isinstance( theDict[dictKey], (tuple,dict,list) ) else 1
-                break # We only check the first (random) entry we get
-            theFile.write( '{} = OrderedDict([\n    # Key is {}\n    # Fields ({}) are: {}\n'.format( dictName, keyComment, fieldsCount, fieldsComment ) )
+            """Exports theDict (in its insertion order) to theFile as an OrderedDict."""
+            assert isinstance( theDict, dict )
+            sampleEntry = next( iter( theDict.values() ) ) # We only check the first entry we get
+            fieldsCount = len( sampleEntry ) if isinstance( sampleEntry, (tuple,dict,list) ) else 1
+            parts = [ '{} = OrderedDict([\n    # Key is {}\n    # Fields ({}) are: {}\n'.format( dictName, keyComment, fieldsCount, fieldsComment ) ]
             for dictKey in theDict.keys():
-                theFile.write( '  ({}, {}),\n'.format( repr(dictKey), repr(theDict[dictKey]) ) )
-            theFile.write( "]), # end of {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+                parts.append( '  ({}, {}),\n'.format( repr(dictKey), repr(theDict[dictKey]) ) )
+            parts.append( "]), # end of {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            theFile.write( ''.join( parts ) ) # One big write rather than one per entry
         # end of exportPythonDict
 
         def exportPythonList( theFile, theList, listName, dummy, fieldsComment ):
             """Exports theList to theFile."""
             assert isinstance( theList, list )
             fieldsCount = len( theList[0] ) if isinstance( theList[0], (tuple,dict,list) ) else 1
-            theFile.write( '{} = [\n    # Fields ({}) are: {}\n'.format( listName, fieldsCount, fieldsComment ) )
+            parts = [ '{} = [\n    # Fields ({}) are: {}\n'.format( listName, fieldsCount, fieldsComment ) ]
             for j,entry in enumerate(theList):
-                theFile.write( '  {}, # {}\n'.format( repr(entry), j ) )
-            theFile.write( "], # end of {} ({} entries)\n\n".format( listName, len(theList) ) )
+                parts.append( '  {}, # {}\n'.format( repr(entry), j ) )
+            parts.append( "], # end of {} ({} entries)\n\n".format( listName, len(theList) ) )
+            theFile.write( ''.join( parts ) ) # One big write rather than one per entry
         # end of exportPythonList
 
-        assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
 
         if not filepath: filepath = os.path.join( os.path.split(self.__XMLFilepath)[0], "DerivedFiles", self._filenameBase + "_Tables.py" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
-        with open( filepath, 'wt', encoding='utf-8' ) as myFile:
+        with open( filepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myFile:
             myFile.write( "# {}\n#\n".format( filepath ) )
             myFile.write( "# This UTF-8 file was automatically generated by USFMMarkers.py V{} on {}\n#\n".format( ProgVersion, datetime.now() ) )
             if self.titleString: myFile.write( "# {} data\n".format( self.titleString ) )
             if self.ProgVersion: myFile.write( "#  Version: {}\n".format( self.ProgVersion ) )
             if self.dateString: myFile.write( "#  Date: {}\n#\n".format( self.dateString ) )
-            myFile.write( "#   {} {} loaded from the original XML file.\n#\n\n".format( len(self._XMLtree), self._treeTag ) )
+            myFile.write( "#   {} {} loaded from the original XML file.\n#\n\n".format( len(self), self._treeTag ) )
             myFile.write( "from collections import OrderedDict\n\n" )
             dictInfo = { "rawMarkerDict":(exportPythonOrderedDict, "rawMarker (in the original XML order)","specified"),
                             "numberedMarkerList":(exportPythonList, "marker","rawMarker"),
@@ -430,22 +509,21 @@ class USFMMarkersConverter:
             myFile.write( "# end of {}".format( os.path.basename(filepath) ) )
     # end of exportDataToPython
 
-    def exportDataToJSON( self, filepath=None ):
+    def exportDataToJSON( self, filepath=None, pretty=False ):
         """
         Writes the information tables to a .json file that can be easily loaded into a Java program.
+            The output is compact unless pretty is set (then it's indented for human reading).
 
         See http://en.wikipedia.org/wiki/JSON.
         """
-        import json
-
-        assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
 
         if not filepath: filepath = os.path.join( os.path.split(self.__XMLFilepath)[0], "DerivedFiles", self._filenameBase + "_Tables.json" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
-        with open( filepath, 'wt', encoding='utf-8' ) as myFile:
-            json.dump( self.__DataDicts, myFile, indent=2 )
+        with open( filepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myFile:
+            if pretty: json.dump( self.__DataDicts, myFile, indent=2 )
+            else: json.dump( self.__DataDicts, myFile, separators=(',',':') )
     # end of exportDataToJSON
 
     def exportDataToC( self, filepath=None ):
@@ -454,34 +532,29 @@ class USFMMarkersConverter:
 
         NOTE: The (optional) filepath should not have the file extension specified -- this is added automatically.
         """
+        # Converters from each Python field type to its C representation (looked up by exact type)
+        fieldConverters = { str: lambda field: '"' + field.replace('"','\\"') + '"',
+                            int: str, bool: str, # NOTE: bool needs its own entry because it's looked up by exact type
+                            type(None): lambda field: '""', }
+
         def exportPythonDict( hFile, cFile, theDict, dictName, sortedBy, structure ):
             """ Exports theDict to the .h and .c files. """
             def convertEntry( entry ):
                 """ Convert special characters in an entry… """
-                result = ""
-                if isinstance( entry, tuple ):
-                    for field in entry:
-                        if result: result += ", " # Separate the fields
-                        if field is None: result += '""'
-                        elif isinstance( field, str): result += '"' + str(field).replace('"','\\"') + '"'
-                        elif isinstance( field, int): result += str(field)
-                        else: logging.error( _("Cannot convert unknown field type {!r} in entry {!r}").format( field, entry ) )
-                elif isinstance( entry, dict ):
-                    for key in sorted(entry.keys()):
-                        field = entry[key]
-                        if result: result += ", " # Separate the fields
-                        if field is None: result += '""'
-                        elif isinstance( field, str): result += '"' + str(field).replace('"','\\"') + '"'
-                        elif isinstance( field, int): result += str(field)
-                        else: logging.error( _("Cannot convert unknown field type {!r} in entry {!r}").format( field, entry ) )
+                def convertUnknownField( field ):
+                    logging.error( _("Cannot convert unknown field type {!r} in entry {!r}").format( field, entry ) )
+                    return ''
+                # end of convertUnknownField
+
+                if isinstance( entry, tuple ): fields = entry
+                elif isinstance( entry, dict ): fields = [entry[key] for key in sorted(entry.keys())]
                 else:
                     logging.error( _("Can't handle this type of entry yet: {}").format( repr(entry) ) )
-                return result
+                    return ''
+                return ', '.join( fieldConverters.get( type(field), convertUnknownField )( field ) for field in fields )
             # end of convertEntry
 
-            for dictKey in theDict.keys(): # Have to iterate this :(
-                fieldsCount = len( theDict[dictKey] ) + 1 # Add one since we include the key in the count
-                break # We only check the first (random) entry we get
+            fieldsCount = len( next( iter( theDict.values() ) ) ) + 1 # Add one since we include the key in the count
 
             #hFile.write( "typedef struct {}EntryStruct { {} } {}Entry;\n\n".format( dictName, structure, dictName ) )
             hFile.write( "typedef struct {}EntryStruct {{\n".format( dictName ) )
@@ -491,7 +564,7 @@ class USFMMarkersConverter:
             hFile.write( "}} {}Entry;\n\n".format( dictName ) )
 
             cFile.write( "const static {}Entry\n {}[{}] = {{\n  // Fields ({}) are {}\n  // Sorted by {}\n".format( dictName, dictName, len(theDict), fieldsCount, structure, sortedBy ) )
-            for dictKey in sorted(theDict.keys()):
+            for dictKey in self.__SortedKeys.get( dictName ) or sorted(theDict.keys()):
                 if isinstance( dictKey, str ):
                     cFile.write( "  {{\"{}\", {}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
                 elif isinstance( dictKey, int ):
@@ -501,7 +574,6 @@ class USFMMarkersConverter:
             cFile.write( "]}}; // {} ({} entries)\n\n".format( dictName, len(theDict) ) )
         # end of exportPythonDict
 
-        assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
 
@@ -512,8 +584,8 @@ class USFMMarkersConverter:
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( cFilepath ) ) # Don't bother telling them about the .h file
         ifdefName = self._filenameBase.upper() + "_Tables_h"
 
-        with open( hFilepath, 'wt', encoding='utf-8' ) as myHFile, \
-             open( cFilepath, 'wt', encoding='utf-8' ) as myCFile:
+        with open( hFilepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myHFile, \
+             open( cFilepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myCFile:
             myHFile.write( "// {}\n//\n".format( hFilepath ) )
             myCFile.write( "// {}\n//\n".format( cFilepath ) )
             lines = "// This UTF-8 file was automatically generated by USFMMarkers.py V{} on {}\n//\n".format( ProgVersion, datetime.now() )
@@ -527,7 +599,7 @@ class USFMMarkersConverter:
             if self.dateString:
                 lines = "//  Date: {}\n//\n".format( self.dateString )
                 myHFile.write( lines ); myCFile.write( lines )
-            myCFile.write( "//   {} {} loaded from the original XML file.\n//\n\n".format( len(self._XMLtree), self._treeTag ) )
+            myCFile.write( "//   {} {} loaded from the original XML file.\n//\n\n".format( len(self), self._treeTag ) )
             myHFile.write( "\n#ifndef {}\n#define {}\n\n".format( ifdefName, ifdefName ) )
             myCFile.write( '#include "{}"\n\n'.format( os.path.basename(hFilepath) ) )
 
@@ -551,6 +623,63 @@ class USFMMarkersConverter:
             myHFile.write( "// end of {}".format( os.path.basename(hFilepath) ) )
             myCFile.write( "// end of {}".format( os.path.basename(cFilepath) ) )
     # end of exportDataToC
+
+
+    def exportMarkerFlagsToC( self, filepath=None ):
+        """
+        Writes .h and .c files containing the USFMMarkers.classifyMarkers flag bits for every marker
+            (including numbered markers like q1) so that C and C++ programs can classify markers
+            with a usfmMarkerFlags( marker ) call (a binary search of the sorted table).
+
+        NOTE: The (optional) filepath should not have the file extension specified -- this is added automatically.
+        """
+        import USFMMarkers # Only needed here (and USFMMarkers itself imports us to load the XML)
+
+        self.importDataToPython()
+        assert self.__DataDicts
+
+        if not filepath: filepath = os.path.join( os.path.split(self.__XMLFilepath)[0], "DerivedFiles", self._filenameBase + "_Flags" )
+        hFilepath = filepath + '.h'
+        cFilepath = filepath + '.c'
+        if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( cFilepath ) ) # Don't bother telling them about the .h file
+        ifdefName = self._filenameBase.upper() + "_Flags_h"
+
+        markerFlags = USFMMarkers.makeMarkerFlagsDict( self.__DataDicts )
+        sortedMarkers = sorted( markerFlags, key=lambda marker: marker.encode( 'utf-8' ) ) # Same order as strcmp
+
+        hParts, cParts = [], []
+        for parts, partFilepath in ( (hParts,hFilepath), (cParts,cFilepath), ):
+            parts.append( "// {}\n//\n".format( partFilepath ) )
+            parts.append( "// This UTF-8 file was automatically generated by USFMMarkersConverter.py V{} on {}\n//\n".format( ProgVersion, datetime.now() ) )
+            if self.titleString: parts.append( "// {} data\n".format( self.titleString ) )
+            if self.ProgVersion: parts.append( "//  Version: {}\n".format( self.ProgVersion ) )
+            if self.dateString: parts.append( "//  Date: {}\n//\n".format( self.dateString ) )
+        hParts.append( "\n#ifndef {}\n#define {}\n\n".format( ifdefName, ifdefName ) )
+        for flagName in USFMMarkers.MARKER_FLAG_NAMES:
+            hParts.append( "#define USFM_MARKER_{}_FLAG 0x{:02x}\n".format( flagName, getattr( USFMMarkers, 'MARKER_{}_FLAG'.format( flagName ) ) ) )
+        hParts.append( "\ntypedef struct USFMMarkerFlagsEntryStruct {\n    const char* marker;\n    const unsigned char flags;\n} USFMMarkerFlagsEntry;\n\n" )
+        hParts.append( "extern const USFMMarkerFlagsEntry USFMMarkerFlags[{}];\n\n".format( len(sortedMarkers) ) )
+        hParts.append( "// Returns the USFM_MARKER_…_FLAG bits for the marker (without the backslash), or 0 if it's not a valid marker\n" )
+        hParts.append( "unsigned char usfmMarkerFlags( const char* marker );\n\n" )
+        hParts.append( "#endif // {}\n\n// end of {}".format( ifdefName, os.path.basename(hFilepath) ) )
+
+        cParts.append( "//   {} markers (including numbered markers) derived from the original XML file.\n//\n\n".format( len(sortedMarkers) ) )
+        cParts.append( '#include <stdlib.h>\n#include <string.h>\n#include "{}"\n\n'.format( os.path.basename(hFilepath) ) )
+        cParts.append( "const USFMMarkerFlagsEntry USFMMarkerFlags[{}] = {{\n  // Sorted by marker (in strcmp order)\n".format( len(sortedMarkers) ) )
+        cParts.extend( '  {{"{}", 0x{:02x}}},\n'.format( marker, markerFlags[marker] ) for marker in sortedMarkers )
+        cParts.append( "}}; // USFMMarkerFlags ({} entries)\n\n".format( len(sortedMarkers) ) )
+        cParts.append( "static int compareMarker( const void* marker, const void* entry ) {\n" )
+        cParts.append( "    return strcmp( (const char*)marker, ((const USFMMarkerFlagsEntry*)entry)->marker );\n}\n\n" )
+        cParts.append( "unsigned char usfmMarkerFlags( const char* marker ) {\n" )
+        cParts.append( "    const USFMMarkerFlagsEntry* entry = bsearch( marker, USFMMarkerFlags, {}, sizeof(USFMMarkerFlagsEntry), compareMarker );\n".format( len(sortedMarkers) ) )
+        cParts.append( "    return entry ? entry->flags : 0;\n}\n\n" )
+        cParts.append( "// end of {}".format( os.path.basename(cFilepath) ) )
+
+        with open( hFilepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myHFile:
+            myHFile.write( ''.join( hParts ) )
+        with open( cFilepath, 'wt', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE ) as myCFile:
+            myCFile.write( ''.join( cParts ) )
+    # end of exportMarkerFlagsToC
 # end of USFMMarkersConverter class
 
 
@@ -564,8 +693,10 @@ def demo():
     if BibleOrgSysGlobals.commandLineArguments.export:
         umc = USFMMarkersConverter().loadAndValidate() # Load the XML
         umc.pickle() # Produce a pickle output file
+        umc.exportDataToMarshal() # Produce a marshal output file
         umc.exportDataToPython() # Produce the .py tables
         umc.exportDataToJSON() # Produce a json output file
+        umc.exportMarkerFlagsToC() # Produce the .h and .c marker flags table
         umc.exportDataToC() # Produce the .h and .c tables
 
     else: # Must be demo mode
@@ -39,7 +39,18 @@ debuggingThisModule = False
 
 
 import logging, os, sys
-from xml.etree.ElementTree import ElementTree, ParseError
+import multiprocessing
+try: # lxml is faster than ElementTree and also gives us source line numbers for our messages
+    from lxml.etree import iterparse as lxmlIterparse, XMLSyntaxError as ParseError
+    def iterparse( source, events ):
+        """
+        Parse the XML file incrementally with lxml, dropping comments and processing instructions like ElementTree does.
+        """
+        return lxmlIterparse( source, events=events, remove_comments=True, remove_pis=True )
+    lxmlAvailable = True
+except ImportError:
+    from xml.etree.ElementTree import iterparse, ParseError # Uses the C accelerator automatically
+    lxmlAvailable = False
 
 import BibleOrgSysGlobals
 from Bible import BibleBook
@@ -61,7 +72,38 @@ def exp( messageString ):
 
 
 
-sortedNLMarkers = None
+newlineMarkersSet = None # Used to find the longest newline marker at the start of an unknown marker
+newlineMarkersMaxLength = 0 # No prefix longer than this can be in newlineMarkersSet
+singleChapterBooksSet = None # BBB codes of the books that only have one chapter
+
+# The attributes that we know how to handle for each USX element
+ROOT_ATTRIBUTE_NAMES = frozenset( ('version',) )
+BOOK_ATTRIBUTE_NAMES = frozenset( ('id','code','style') )
+CHAPTER_ATTRIBUTE_NAMES = frozenset( ('number','style','pubnumber') )
+VERSE_ATTRIBUTE_NAMES = frozenset( ('number','style','altnumber','pubnumber') )
+PARA_ATTRIBUTE_NAMES = frozenset( ('style',) )
+CHAR_ATTRIBUTE_NAMES = frozenset( ('style','closed') )
+NOTE_ATTRIBUTE_NAMES = frozenset( ('style','caller') )
+REF_ATTRIBUTE_NAMES = frozenset( ('loc',) )
+UNMATCHED_ATTRIBUTE_NAMES = frozenset( ('marker',) )
+LINK_ATTRIBUTE_NAMES = frozenset( ('style','display','target') )
+FIGURE_ATTRIBUTE_NAMES = frozenset( ('style','desc','file','size','loc','copy','ref') )
+ROW_ATTRIBUTE_NAMES = frozenset( ('style',) )
+CELL_ATTRIBUTE_NAMES = frozenset( ('style','align') )
+
+
+def reportUnknownAttributes( attributes, knownAttributeNames, logFunction, messageString, locationString ):
+    """
+    Log each of the given element attributes that isn't in knownAttributeNames
+        using the given log function and message (which is formatted with the attribute name, value, and location).
+
+    Only called after the caller has found that there is at least one such attribute.
+    """
+    for attrib,value in attributes.items():
+        if attrib not in knownAttributeNames:
+            logFunction( messageString.format( attrib, value, locationString ) )
+            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+# end of reportUnknownAttributes
 
 
 
@@ -77,9 +119,13 @@ class USXXMLBibleBook( BibleBook ):
         self.objectNameString = 'USX XML Bible Book object'
         self.objectTypeString = 'USX'
 
-        global sortedNLMarkers
-        if sortedNLMarkers is None:
-            sortedNLMarkers = sorted( BibleOrgSysGlobals.USFMMarkers.getNewlineMarkersList('Combined'), key=len, reverse=True )
+        global newlineMarkersSet, newlineMarkersMaxLength
+        if newlineMarkersSet is None:
+            newlineMarkersSet = frozenset( BibleOrgSysGlobals.USFMMarkers.getNewlineMarkersList('Combined') )
+            newlineMarkersMaxLength = max( len(marker) for marker in newlineMarkersSet )
+        global singleChapterBooksSet
+        if singleChapterBooksSet is None:
+            singleChapterBooksSet = frozenset( BibleOrgSysGlobals.BibleBooksCodes.getSingleChapterBooksList() )
         #self.BBB = BBB
     # end of USXXMLBibleBook.__init__
 
@@ -94,6 +140,35 @@ class USXXMLBibleBook( BibleBook ):
         C, V = '0', '-1' # So id line starts at 0:0
         loadErrors = []
 
+        # Local names for things that we use on every element (none of them change while we load the book)
+        isNewlineMarker = BibleOrgSysGlobals.USFMMarkers.isNewlineMarker
+        isInternalMarker = BibleOrgSysGlobals.USFMMarkers.isInternalMarker
+        isBlank = BibleOrgSysGlobals.isBlank
+        strictCheckingFlag = BibleOrgSysGlobals.strictCheckingFlag
+        if BibleOrgSysGlobals.checkXMLFlag or strictCheckingFlag:
+            checkXMLNoText, checkXMLNoTail = BibleOrgSysGlobals.checkXMLNoText, BibleOrgSysGlobals.checkXMLNoTail
+            checkXMLNoAttributes, checkXMLNoSubelements = BibleOrgSysGlobals.checkXMLNoAttributes, BibleOrgSysGlobals.checkXMLNoSubelements
+        else: # trusted input, so don't waste time checking the XML structure
+            def skipXMLCheck( element, locationString, idString=None ): pass
+            checkXMLNoText = checkXMLNoTail = checkXMLNoAttributes = checkXMLNoSubelements = skipXMLCheck
+        BBB = self.BBB
+        addLine, addPriorityError = self.addLine, self.addPriorityError
+        if BibleOrgSysGlobals.debugFlag: appendToLastLine = self.appendToLastLine # which does extra checking
+        else: # use our own faster version
+            rawLines = self._rawLines
+            def appendToLastLine( additionalText ):
+                """
+                Append some extra text to the last line that we added.
+
+                Does the same as self.appendToLastLine (without the debug checks)
+                    but avoids the method call for every verse, char, and note.
+                """
+                if '\n' in additionalText or '\r' in additionalText: self.appendToLastLine( additionalText ) # Let it complain
+                else:
+                    marker, text = rawLines[-1]
+                    rawLines[-1] = (marker, text + additionalText)
+            # end of appendToLastLine
+
 
         def loadVerseNumberField( verseNumberElement, verseNumberLocation ):
             """
@@ -104,34 +179,31 @@ class USXXMLBibleBook( BibleBook ):
             Has no return value -- updates the data fields directly.
             """
             nonlocal V
-            #print( "loadVerseNumberField( {}, {} @ {} {}:{} )".format( verseNumberElement.tag, verseNumberLocation, self.BBB, C, V ) )
+            #print( "loadVerseNumberField( {}, {} @ {} {}:{} )".format( verseNumberElement.tag, verseNumberLocation, BBB, C, V ) )
             assert verseNumberElement.tag == 'verse'
 
-            BibleOrgSysGlobals.checkXMLNoText( verseNumberElement, verseNumberLocation )
-            BibleOrgSysGlobals.checkXMLNoSubelements( verseNumberElement, verseNumberLocation )
+            checkXMLNoText( verseNumberElement, verseNumberLocation )
+            checkXMLNoSubelements( verseNumberElement, verseNumberLocation )
             # Process the attributes first
-            verseStyle = altNumber = pubNumber = None
-            for attrib,value in verseNumberElement.items():
-                if attrib=='number': V = value
-                elif attrib=='style': verseStyle = value
-                elif attrib=='altnumber': altNumber = value
-                elif attrib=='pubnumber': pubNumber = value # TODO: not used anywhere!
-                else:
-                    logging.error( _("KR60 Unprocessed {} attribute ({}) in {}").format( attrib, value, verseNumberLocation ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            attributes = verseNumberElement.attrib
+            V = attributes.get( 'number', V )
+            verseStyle, altNumber = attributes.get( 'style' ), attributes.get( 'altnumber' )
+            pubNumber = attributes.get( 'pubnumber' ) # TODO: not used anywhere!
+            if not VERSE_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, VERSE_ATTRIBUTE_NAMES, logging.error, _("KR60 Unprocessed {} attribute ({}) in {}"), verseNumberLocation )
             if verseStyle != 'v':
                 logging.error( _("Unexpected style attribute ({}) in {}").format( verseStyle, verseNumberLocation ) )
                 if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
             #if altNumber: print( repr(verseStyle), repr(altNumber) ); halt
             altStuff = ' \\va {}\\va*'.format( altNumber ) if altNumber else ''
-            self.addLine( verseStyle, V + altStuff + ' ' )
+            addLine( verseStyle, V + altStuff + ' ' )
             # Now process the tail (if there's one) which is the verse text
-            if verseNumberElement.tail:
-                vText = verseNumberElement.tail
+            vText = verseNumberElement.tail
+            if vText:
                 if vText[0]=='\n': vText = vText.lstrip() # Paratext puts cross references on a new line
                 if vText:
                     #print( repr(vText) )
-                    self.appendToLastLine( vText )
+                    appendToLastLine( vText )
         # end of loadVerseNumberField
 
 
@@ -143,76 +215,72 @@ class USXXMLBibleBook( BibleBook ):
 
             Results the result as a string (to be appended to whatever came before)
             """
-            #print( "loadCharField( {}, {} @ {} {}:{} )".format( charElement.tag, charLocation, self.BBB, C, V ) )
+            #print( "loadCharField( {}, {} @ {} {}:{} )".format( charElement.tag, charLocation, BBB, C, V ) )
             assert charElement.tag == 'char'
 
             # Process the attributes first
-            charStyle = charClosed = None
-            for attrib,value in charElement.items():
-                if attrib=='style':
-                    charStyle = value # This is basically the USFM character marker name
-                    #print( "  charStyle", charStyle )
-                    assert not BibleOrgSysGlobals.USFMMarkers.isNewlineMarker( charStyle )
-                elif attrib == 'closed':
-                    assert value == 'false'
-                    charClosed = False
-                else:
-                    logging.error( _("QU52 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-            if BibleOrgSysGlobals.isBlank( charElement.text): charLine = '\\{} '.format( charStyle )
-            else: charLine = '\\{} {} '.format( charStyle, charElement.text )
-            assert '\n' not in charLine
+            attributes = charElement.attrib
+            charStyle = attributes.get( 'style' ) # This is basically the USFM character marker name
+            #print( "  charStyle", charStyle )
+            if charStyle is not None: assert not isNewlineMarker( charStyle )
+            charClosed = attributes.get( 'closed' )
+            if charClosed is not None:
+                assert charClosed == 'false'
+                charClosed = False
+            if not CHAR_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, CHAR_ATTRIBUTE_NAMES, logging.error, _("QU52 Unprocessed {} attribute ({}) in {}"), location )
+            charMarker = '\\' + str( charStyle )
+            charText = charElement.text
+            if isBlank( charText ): charParts = [ charMarker + ' ' ]
+            else: charParts = [ charMarker + ' ' + charText + ' ' ]
+            assert '\n' not in charParts[0]
 
             # Now process the subelements -- chars are one of the few multiply embedded fields in USX
             for subelement in charElement:
                 sublocation = subelement.tag + ' ' + location
-                #print( '{} {}:{} {}'.format( self.BBB, C, V, charElement.tag ) )
+                #print( '{} {}:{} {}'.format( BBB, C, V, charElement.tag ) )
                 if subelement.tag == 'char': # milestone (not a container)
-                    charLine += loadCharField( subelement, sublocation ) # recursive call
+                    charParts.append( loadCharField( subelement, sublocation ) ) # recursive call
                 elif subelement.tag == 'ref':
                     #print( "ref", BibleOrgSysGlobals.elementStr( subelement ) )
-                    BibleOrgSysGlobals.checkXMLNoSubelements( subelement, sublocation )
+                    checkXMLNoSubelements( subelement, sublocation )
                     # Process the attribute first
-                    refLoc = None
-                    for attrib,value in subelement.items():
-                        if attrib=='loc': refLoc = value
-                        else:
-                            logging.warning( _("KF24 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+                    refLoc = subelement.get( 'loc' )
+                    if not REF_ATTRIBUTE_NAMES.issuperset( subelement.attrib ):
+                        reportUnknownAttributes( subelement.attrib, REF_ATTRIBUTE_NAMES, logging.warning, _("KF24 Unprocessed {} attribute ({}) in {}"), location )
                     #print( "ref", refLoc, repr(charElement.text), repr(charElement.tail), repr(charElement.text + (charElement.tail if element.tail else '')) )
-                    charLine += (charElement.text if not BibleOrgSysGlobals.isBlank(charElement.text) else '') \
-                                + (charElement.tail if not BibleOrgSysGlobals.isBlank(charElement.tail) else '')
+                    charParts.append( (charElement.text if not isBlank(charElement.text) else '') \
+                                + (charElement.tail if not isBlank(charElement.tail) else '') )
                     # TODO: How do we save reference in USFM???
                 elif subelement.tag == 'note':
                     #print( "NOTE", BibleOrgSysGlobals.elementStr( subelement ) )
                     processedNoteField = loadNoteField( subelement, sublocation )
-                    if BibleOrgSysGlobals.strictCheckingFlag:
+                    if strictCheckingFlag:
                         assert '\n' not in processedNoteField
                         assert '\t' not in processedNoteField
-                    charLine += processedNoteField
+                    charParts.append( processedNoteField )
                 else:
-                    logging.error( _("BD23 Unprocessed {} subelement ({}) after {} {}:{} in {}").format( subelement.tag, subelement.text.strip() if subelement.text else subelement.text, self.BBB, C, V, sublocation ) )
-                    self.addPriorityError( 1, C, V, _("Unprocessed {} subelement").format( subelement.tag ) )
+                    logging.error( _("BD23 Unprocessed {} subelement ({}) after {} {}:{} in {}").format( subelement.tag, subelement.text.strip() if subelement.text else subelement.text, BBB, C, V, sublocation ) )
+                    addPriorityError( 1, C, V, _("Unprocessed {} subelement").format( subelement.tag ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                if BibleOrgSysGlobals.strictCheckingFlag:
-                    assert '\n' not in charLine
-                    assert '\t' not in charLine
+                if strictCheckingFlag:
+                    assert '\n' not in charParts[-1]
+                    assert '\t' not in charParts[-1]
             if charClosed != False:
-                charLine += '\\{}*'.format( charStyle )
+                charParts.append( charMarker + '*' )
             # A character field must be added to the previous field
             #if charElement.tail is not None: print( " tail2", repr(charElement.tail) )
-            charTail = ''
-            if charElement.tail:
-                charTail = charElement.tail
+            charTail = charElement.tail or ''
+            if charTail:
                 if charTail[0]=='\n': charTail = charTail.lstrip() # Paratext puts footnote parts on new lines
                 if charTail and charTail[-1] in ('\n','\t'): charTail = charTail.rstrip()
-            #print( "charLine", repr(charLine), "charStyle", repr(charStyle), "charTail", repr(charTail) )
-            if BibleOrgSysGlobals.strictCheckingFlag:
-                assert '\n' not in charLine
+            #print( "charParts", repr(charParts), "charStyle", repr(charStyle), "charTail", repr(charTail) )
+            if strictCheckingFlag:
                 assert '\n' not in charStyle
                 assert '\n' not in charTail
-            charLine += charTail
-            if debuggingThisModule: print( "USX.loadCharField: {} {}:{} {} {!r}".format( self.BBB, C, V, charStyle, charLine ) )
+            charParts.append( charTail )
+            charLine = ''.join( charParts )
+            if debuggingThisModule: print( "USX.loadCharField: {} {}:{} {} {!r}".format( BBB, C, V, charStyle, charLine ) )
             assert '\n' not in charLine
             return charLine
         # end of loadCharField
@@ -226,67 +294,61 @@ class USXXMLBibleBook( BibleBook ):
 
             Results the result as a string (to be appended to whatever came before)
             """
-            #print( "loadNoteField( {}, {} @ {} {}:{} )".format( noteElement.tag, noteLocation, self.BBB, C, V ) )
+            #print( "loadNoteField( {}, {} @ {} {}:{} )".format( noteElement.tag, noteLocation, BBB, C, V ) )
             #print( "  {}".format( BibleOrgSysGlobals.elementStr( noteElement ) ) )
             assert noteElement.tag == 'note'
 
             # Process the attributes first
-            noteStyle = noteCaller = None
-            for attrib,value in noteElement.items():
-                if attrib=='style':
-                    noteStyle = value # This is basically the USFM marker name
-                    assert noteStyle in ('x','f','fe')
-                elif attrib=='caller':
-                    noteCaller = value # Usually hyphen or plus or a symbol to be used for the note
-                else:
-                    logging.error( _("CY38 Unprocessed {} attribute ({}) in {}").format( attrib, value, noteLocation ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-            #if noteCaller=='' and self.BBB=='NUM' and C=='10' and V=='36': noteCaller = '+' # Hack
+            attributes = noteElement.attrib
+            noteStyle = attributes.get( 'style' ) # This is basically the USFM marker name
+            if noteStyle is not None: assert noteStyle in ('x','f','fe')
+            noteCaller = attributes.get( 'caller' ) # Usually hyphen or plus or a symbol to be used for the note
+            if not NOTE_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, NOTE_ATTRIBUTE_NAMES, logging.error, _("CY38 Unprocessed {} attribute ({}) in {}"), noteLocation )
+            #if noteCaller=='' and BBB=='NUM' and C=='10' and V=='36': noteCaller = '+' # Hack
             assert noteStyle and noteCaller # both compulsory
-            noteField = '\\{} {} '.format( noteStyle, noteCaller )
+            noteParts = [ '\\' + noteStyle + ' ' + noteCaller + ' ' ]
             if noteElement.text:
                 noteText = noteElement.text.strip()
-                noteField += noteText
+                noteParts.append( noteText )
 
             # Now process the subelements -- notes are one of the few multiply embedded fields in USX
             for subelement in noteElement:
                 sublocation = subelement.tag + ' ' + noteLocation
-                #print( C, V, subelement.tag, repr(noteField) )
+                #print( C, V, subelement.tag, repr(noteParts) )
                 if subelement.tag == 'char': # milestone (not a container)
                     noteCharField = loadCharField( subelement, sublocation )
                     #print( "noteCharField: {!r}".format( noteCharField ) )
-                    noteField += noteCharField
+                    noteParts.append( noteCharField )
                 elif subelement.tag == 'unmatched': # Used to denote errors in the source text
-                    BibleOrgSysGlobals.checkXMLNoText( subelement, sublocation )
-                    BibleOrgSysGlobals.checkXMLNoSubelements( subelement, sublocation )
+                    checkXMLNoText( subelement, sublocation )
+                    checkXMLNoSubelements( subelement, sublocation )
                     # Process the attributes first
-                    unmmatchedMarker = None
-                    for attrib,value in subelement.items():
-                        if attrib=='marker':
-                            unmmatchedMarker = value
-                        else:
-                            logging.warning( _("NV21 Unprocessed {} attribute ({}) in {}").format( attrib, value, sublocation ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    self.addPriorityError( 2, C, V, _("Unmatched subelement for {} in {}").format( repr(unmmatchedMarker), sublocation) if unmmatchedMarker else _("Unmatched subelement in {}").format( sublocation) )
+                    unmmatchedMarker = subelement.get( 'marker' )
+                    if not UNMATCHED_ATTRIBUTE_NAMES.issuperset( subelement.attrib ):
+                        reportUnknownAttributes( subelement.attrib, UNMATCHED_ATTRIBUTE_NAMES, logging.warning, _("NV21 Unprocessed {} attribute ({}) in {}"), sublocation )
+                    addPriorityError( 2, C, V, _("Unmatched subelement for {} in {}").format( repr(unmmatchedMarker), sublocation) if unmmatchedMarker else _("Unmatched subelement in {}").format( sublocation) )
                 else:
-                    logging.error( _("Unprocessed {} subelement after {} {}:{} in {}").format( subelement.tag, self.BBB, C, V, sublocation ) )
-                    self.addPriorityError( 1, C, V, _("Unprocessed {} subelement").format( subelement.tag ) )
+                    logging.error( _("Unprocessed {} subelement after {} {}:{} in {}").format( subelement.tag, BBB, C, V, sublocation ) )
+                    addPriorityError( 1, C, V, _("Unprocessed {} subelement").format( subelement.tag ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                #print( BibleOrgSysGlobals.isBlank( subelement.tail ), repr(subelement.tail), repr(noteField) )
-                if not BibleOrgSysGlobals.isBlank( subelement.tail ): noteField += subelement.tail
-                assert '\n' not in noteField
-            noteField += '\\{}*'.format( noteStyle )
+                #print( isBlank( subelement.tail ), repr(subelement.tail), repr(noteParts) )
+                subTail = subelement.tail
+                if not isBlank( subTail ): noteParts.append( subTail )
+                assert '\n' not in noteParts[-1]
+            noteParts.append( '\\' + noteStyle + '*' )
+            noteField = ''.join( noteParts )
 
             if noteElement.text: # no note text!
                 if len(noteElement) == 0: # no subelements either
-                    logging.error( _("Note ({}) has no text at {} {}:{} {} -- note will be ignored").format( noteStyle, self.BBB, C, V, noteLocation ) )
+                    logging.error( _("Note ({}) has no text at {} {}:{} {} -- note will be ignored").format( noteStyle, BBB, C, V, noteLocation ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
             assert '\n' not in noteField
 
             # Now process the left-overs (tail)
-            if noteElement.tail:
-                #if '\n' in noteElement.tail: halt
-                noteTail = noteElement.tail
+            noteTail = noteElement.tail
+            if noteTail:
+                #if '\n' in noteTail: halt
                 if noteTail[0] in ('\n','\t'): noteTail = noteTail.lstrip() # Paratext puts multiple cross-references on new lines
                 if noteTail and noteTail[-1] in ('\n','\t'): noteTail = noteTail.rstrip()
                 noteField += noteTail
@@ -297,337 +359,414 @@ class USXXMLBibleBook( BibleBook ):
         # end of loadNoteField
 
 
+        def appendCharField( element, location ):
+            """
+            Load a char field from the USX XML and append it to the current line.
+            """
+            charLine = loadCharField( element, location )
+            appendToLastLine( charLine )
+        # end of appendCharField
+
+
+        def appendNoteField( element, location ):
+            """
+            Load a note field from the USX XML and append it to the current line.
+            """
+            #print( "NOTE", BibleOrgSysGlobals.elementStr( element ) )
+            processedNoteField = loadNoteField( element, location )
+            if strictCheckingFlag: assert '\n' not in processedNoteField
+            appendToLastLine( processedNoteField )
+        # end of appendNoteField
+
+
+        def loadLinkField( element, location ):
+            """
+            Load a link field (used to include extra resources) from the USX XML.
+            """
+            checkXMLNoText( element, location )
+            checkXMLNoTail( element, location )
+            checkXMLNoSubelements( element, location )
+            # Process the attributes first
+            attributes = element.attrib
+            linkStyle = attributes.get( 'style' )
+            if linkStyle is not None: assert linkStyle in ('jmp',)
+            linkDisplay = attributes.get( 'display' ) # e.g., "click here"
+            linkTarget = attributes.get( 'target' ) # e.g., some reference
+            if not LINK_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, LINK_ATTRIBUTE_NAMES, logging.warning, _("KW54 Unprocessed {} attribute ({}) in {}"), location )
+            addPriorityError( 3, C, V, _("Unprocessed {} link to {} in {}").format( repr(linkDisplay), repr(linkTarget), location) )
+        # end of loadLinkField
+
+
+        def loadUnmatchedField( element, location ):
+            """
+            Load an unmatched field (used to denote errors in the source text) from the USX XML.
+            """
+            checkXMLNoText( element, location )
+            #checkXMLNoAttributes( element, location ) # We ignore attributes!!! XXXXXXXXXX
+            checkXMLNoSubelements( element, location )
+            addPriorityError( 2, C, V, _("Unmatched element in {}").format( location) )
+            tail = element.tail
+            if not isBlank( tail ): appendToLastLine( tail )
+        # end of loadUnmatchedField
+
+
+        def loadOptbreakField( element, location ):
+            """
+            Load an optional break field from the USX XML.
+            """
+            checkXMLNoText( element, location )
+            checkXMLNoAttributes( element, location )
+            checkXMLNoSubelements( element, location )
+            tail = element.tail
+            if not isBlank( tail ): appendToLastLine( '//' + tail )
+        # end of loadOptbreakField
+
+
+        def loadRefField( element, location ):
+            """
+            Load a ref field (in later USX versions) from the USX XML.
+            """
+            checkXMLNoSubelements( element, location )
+            # Process the attribute first
+            refLoc = element.get( 'loc' )
+            if not REF_ATTRIBUTE_NAMES.issuperset( element.attrib ):
+                reportUnknownAttributes( element.attrib, REF_ATTRIBUTE_NAMES, logging.warning, _("KW74 Unprocessed {} attribute ({}) in {}"), location )
+            #print( "ref", refLoc, repr(element.text), repr(element.tail), repr(element.text + (element.tail if element.tail else '')) )
+            appendToLastLine( element.text + (element.tail or '') )
+            # TODO: How do we save reference in USFM???
+        # end of loadRefField
+
+
+        def loadFigureField( element, location ):
+            """
+            Load a figure field from the USX XML.
+            """
+            checkXMLNoSubelements( element, location, 'FG11' )
+            # Process the attributes first
+            attributes = element.attrib
+            figStyle = attributes.get( 'style', '' )
+            if figStyle: assert figStyle == 'fig'
+            figDesc, figFile, figSize = attributes.get( 'desc', '' ), attributes.get( 'file', '' ), attributes.get( 'size', '' )
+            figLoc, figCopy, figRef = attributes.get( 'loc', '' ), attributes.get( 'copy', '' ), attributes.get( 'ref', '' )
+            if not FIGURE_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, FIGURE_ATTRIBUTE_NAMES, logging.warning, _("KW84 Unprocessed {} attribute ({}) in {}"), location )
+            figCaption = element.text
+            figLine = '\\fig {}|{}|{}|{}|{}|{}|{}\\fig*'.format( figDesc, figFile, figSize, figLoc, figCopy, figCaption, figRef )
+            #print( "figLine", figLine )
+            appendToLastLine( figLine )
+            tail = element.tail
+            if not isBlank( tail ): appendToLastLine( tail )
+        # end of loadFigureField
+
+
+        # NOTE: We don't sys.intern() the tags before these lookups:
+        #   the parser already reuses a single string object for each tag name (so its hash is only calculated once)
+        #   and interning every element's tag would cost another dict lookup per element.
+        paragraphFieldLoaders = { # What to do with each element found inside a paragraph
+            'verse':loadVerseNumberField, # milestone (not a container in USX)
+            'char':appendCharField, 'note':appendNoteField,
+            'link':loadLinkField, 'unmatched':loadUnmatchedField, 'optbreak':loadOptbreakField,
+            'ref':loadRefField, 'figure':loadFigureField }
+        getParagraphFieldLoader = paragraphFieldLoaders.get
+
+
         def loadParagraph( paragraphXML, paragraphlocation ):
             """
             Load a paragraph from the USX XML.
             In this context, paragraph means heading and intro lines,
                 as well as paragraphs of verses.
 
-            Uses (and updates) C,V information from the containing function.
+            Uses C,V information from the containing function
+                (the verse loader is the one that updates it).
             """
-            nonlocal C, V
-
             # Process the attributes first
-            paragraphStyle = None
-            for attrib,value in paragraphXML.items():
-                if attrib=='style': paragraphStyle = value # This is basically the USFM marker name
-                else:
-                    logging.warning( _("CH46 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            paragraphStyle = paragraphXML.get( 'style' ) # This is basically the USFM marker name
+            if not PARA_ATTRIBUTE_NAMES.issuperset( paragraphXML.attrib ):
+                reportUnknownAttributes( paragraphXML.attrib, PARA_ATTRIBUTE_NAMES, logging.warning, _("CH46 Unprocessed {} attribute ({}) in {}"), paragraphlocation )
 
             # Now process the paragraph text (or write a paragraph marker anyway)
-            paragraphText = paragraphXML.text if paragraphXML.text and paragraphXML.text.strip() else ''
+            paragraphText = paragraphXML.text
+            if not paragraphText or not paragraphText.strip(): paragraphText = ''
             if version is None: paragraphText = paragraphText.rstrip() # Don't need to strip extra spaces in v2
             #print( "USXXMLBibleBook.load newLine: {!r} {!r}".format( paragraphStyle, paragraphText ) )
-            self.addLine( paragraphStyle, paragraphText )
+            addLine( paragraphStyle, paragraphText )
 
             # Now process the paragraph subelements
             for element in paragraphXML:
-                location = element.tag + ' ' + paragraphlocation
-                #print( "USXXMLBibleBook.load {}:{} {!r} in {}".format( C, V, element.tag, location ) )
-                if element.tag == 'verse': # milestone (not a container in USX)
-                    loadVerseNumberField( element, location )
-                    #BibleOrgSysGlobals.checkXMLNoText( element, location )
-                    #BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    ## Process the attributes first
-                    #verseStyle = altNumber = pubNumber = None
-                    #for attrib,value in element.items():
-                        #if attrib=='number': V = value
-                        #elif attrib=='style': verseStyle = value
-                        #elif attrib=='altnumber': altNumber = value
-                        #elif attrib=='pubnumber': pubNumber = value # TODO: not used anywhere!
-                        #else:
-                            #logging.error( _("KR60 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            #if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    #if verseStyle != 'v':
-                        #logging.error( _("Unexpected style attribute ({}) in {}").format( verseStyle, location ) )
-                        #if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    ##if altNumber: print( repr(verseStyle), repr(altNumber) ); halt
-                    #altStuff = ' \\va {}\\va*'.format( altNumber ) if altNumber else ''
-                    #self.addLine( verseStyle, V + altStuff + ' ' )
-                    ## Now process the tail (if there's one) which is the verse text
-                    #if element.tail:
-                        #vText = element.tail
-                        #if vText[0]=='\n': vText = vText.lstrip() # Paratext puts cross references on a new line
-                        #if vText:
-                            ##print( repr(vText) )
-                            #self.appendToLastLine( vText )
-                elif element.tag == 'char':
-                    charLine = loadCharField( element, location )
-                    self.appendToLastLine( charLine )
-                elif element.tag == 'note':
-                    #print( "NOTE", BibleOrgSysGlobals.elementStr( element ) )
-                    processedNoteField = loadNoteField( element, location )
-                    if BibleOrgSysGlobals.strictCheckingFlag: assert '\n' not in processedNoteField
-                    self.appendToLastLine( processedNoteField )
-                elif element.tag == 'link': # Used to include extra resources
-                    BibleOrgSysGlobals.checkXMLNoText( element, location )
-                    BibleOrgSysGlobals.checkXMLNoTail( element, location )
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    # Process the attributes first
-                    linkStyle = linkDisplay = linkTarget = None
-                    for attrib,value in element.items():
-                        if attrib=='style':
-                            linkStyle = value
-                            assert linkStyle in ('jmp',)
-                        elif attrib=='display':
-                            linkDisplay = value # e.g., "click here"
-                        elif attrib=='target':
-                            linkTarget = value # e.g., some reference
-                        else:
-                            logging.warning( _("KW54 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    self.addPriorityError( 3, C, V, _("Unprocessed {} link to {} in {}").format( repr(linkDisplay), repr(linkTarget), location) )
-                elif element.tag == 'unmatched': # Used to denote errors in the source text
-                    BibleOrgSysGlobals.checkXMLNoText( element, location )
-                    #BibleOrgSysGlobals.checkXMLNoAttributes( element, location ) # We ignore attributes!!! XXXXXXXXXX
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    self.addPriorityError( 2, C, V, _("Unmatched element in {}").format( location) )
-                    if not BibleOrgSysGlobals.isBlank( element.tail ): self.appendToLastLine( element.tail )
-                elif element.tag == 'optbreak':
-                    BibleOrgSysGlobals.checkXMLNoText( element, location )
-                    BibleOrgSysGlobals.checkXMLNoAttributes( element, location )
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    if not BibleOrgSysGlobals.isBlank( element.tail ): self.appendToLastLine( '//' + element.tail )
-                elif element.tag == 'ref': # In later USX versions
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    # Process the attribute first
-                    refLoc = None
-                    for attrib,value in element.items():
-                        if attrib=='loc': refLoc = value
-                        else:
-                            logging.warning( _("KW74 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    #print( "ref", refLoc, repr(element.text), repr(element.tail), repr(element.text + (element.tail if element.tail else '')) )
-                    self.appendToLastLine( element.text + (element.tail if element.tail else '') )
-                    # TODO: How do we save reference in USFM???
-                elif element.tag == 'figure':
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location, 'FG11' )
-                    # Process the attributes first
-                    figStyle = figDesc = figFile = figSize = figLoc = figCopy = figRef = ''
-                    for attrib,value in element.items():
-                        if attrib=='style': figStyle = value; assert figStyle == 'fig'
-                        elif attrib=='desc': figDesc = value
-                        elif attrib=='file': figFile = value
-                        elif attrib=='size': figSize = value
-                        elif attrib=='loc': figLoc = value
-                        elif attrib=='copy': figCopy = value
-                        elif attrib=='ref': figRef = value
-                        else:
-                            logging.warning( _("KW84 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    figCaption = element.text
-                    figLine = '\\fig {}|{}|{}|{}|{}|{}|{}\\fig*'.format( figDesc, figFile, figSize, figLoc, figCopy, figCaption, figRef )
-                    #print( "figLine", figLine )
-                    self.appendToLastLine( figLine )
-                    if not BibleOrgSysGlobals.isBlank( element.tail ): self.appendToLastLine( element.tail )
+                tag = element.tag
+                location = tag + '@' + str( element.sourceline ) + ' ' + paragraphlocation if lxmlAvailable \
+                                else tag + ' ' + paragraphlocation
+                #print( "USXXMLBibleBook.load {}:{} {!r} in {}".format( C, V, tag, location ) )
+                loader = getParagraphFieldLoader( tag )
+                if loader is not None: loader( element, location )
                 else:
-                    logging.warning( _("SW22 Unprocessed {} element after {} {}:{} in {}").format( element.tag, self.BBB, C, V, location ) )
-                    self.addPriorityError( 1, C, V, _("Unprocessed {} element").format( element.tag ) )
+                    logging.warning( _("SW22 Unprocessed {} element after {} {}:{} in {}").format( tag, BBB, C, V, location ) )
+                    addPriorityError( 1, C, V, _("Unprocessed {} element").format( tag ) )
                     for x in range(max(0,len(self)-10),len(self)): print( x, self._rawLines[x] )
                     if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.strictCheckingFlag: halt
         # end of loadParagraph
 
 
+        def loadBookField( element, location ):
+            """
+            Load the book field (a milestone, not a container) from the USX XML.
+            """
+            checkXMLNoSubelements( element, location )
+            checkXMLNoTail( element, location )
+            # Process the attributes
+            attributes = element.attrib
+            idField = attributes.get( 'code' ) or attributes.get( 'id' ) # Should be USFM bookcode (not like BBB which is BibleOrgSys BBB bookcode)
+            #if idField != BBB:
+            #    logging.warning( _("Unexpected book code ({}) in {}").format( idField, location ) )
+            bookStyle = attributes.get( 'style' )
+            if not BOOK_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, BOOK_ATTRIBUTE_NAMES, logging.warning, _("MD12 Unprocessed {} attribute ({}) in {}"), location )
+            if bookStyle != 'id':
+                logging.warning( _("Unexpected style attribute ({}) in {}").format( bookStyle, location ) )
+                if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            idLine = idField
+            idText = element.text
+            if idText and idText.strip(): idLine += ' ' + idText
+            addLine( 'id', idLine )
+        # end of loadBookField
+
+
+        def loadChapterField( element, location ):
+            """
+            Load a chapter field (a milestone, not a container) from the USX XML.
+
+            Updates C,V information in the containing function.
+            """
+            nonlocal C, V
+            V = '0'
+            checkXMLNoText( element, location )
+            checkXMLNoTail( element, location )
+            checkXMLNoSubelements( element, location )
+            # Process the attributes
+            attributes = element.attrib
+            C = attributes.get( 'number', C )
+            chapterStyle, pubNumber = attributes.get( 'style' ), attributes.get( 'pubnumber' )
+            if not CHAPTER_ATTRIBUTE_NAMES.issuperset( attributes ):
+                reportUnknownAttributes( attributes, CHAPTER_ATTRIBUTE_NAMES, logging.error, _("LY76 Unprocessed {} attribute ({}) in {}"), location )
+            if chapterStyle != 'c':
+                logging.warning( _("Unexpected style attribute ({}) in {}").format( chapterStyle, location ) )
+                if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            #if pubNumber: print( BBB, C, repr(pubNumber) ); halt
+            addLine( 'c', C )
+            if pubNumber: addLine( 'cp', pubNumber )
+        # end of loadChapterField
+
+
+        def noteLineStartProblem( logFunction, problemDescription, text ):
+            """
+            Record a problem with the marker at the beginning of a line
+                in both the load errors and the log.
+            """
+            textDescription = _("with text: {}").format( text ) if text else _("(with no text)")
+            loadErrors.append( _("{} {}:{} {} at beginning of line {}").format( BBB, C, V, problemDescription, textDescription ) )
+            logFunction( _("{} after {} {}:{} at beginning of line {}").format( problemDescription, BBB, C, V, textDescription ) )
+        # end of noteLineStartProblem
+
+
+        def loadParaField( element, location ):
+            """
+            Load a para field from the USX XML
+                checking that it starts with a known newline marker.
+            """
+            nonlocal lastMarker, lastText
+            checkXMLNoTail( element, location )
+            USFMMarker = element.attrib['style'] # Get the USFM code for the paragraph style
+            if isNewlineMarker( USFMMarker ):
+                #if lastMarker: addLine( lastMarker, lastText )
+                #lastMarker, lastText = USFMMarker, text
+                loadParagraph( element, location )
+            elif isInternalMarker( USFMMarker ): # the line begins with an internal USFM Marker -- append it to the previous line
+                text = element.text
+                if text is None: text = ''
+                if BibleOrgSysGlobals.debugFlag:
+                    print( _("{} {}:{} Found '\\{}' internal USFM marker at beginning of line with text: {}").format( BBB, C, V, USFMMarker, text ) )
+                    #halt # Not checked yet
+                noteLineStartProblem( logging.warning, _("Found '\\{}' internal USFM Marker").format( USFMMarker ), text )
+                addPriorityError( 97, C, V, _("Found \\{} internal USFM Marker on new line in file").format( USFMMarker ) )
+                #lastText += '' if lastText.endswith(' ') else ' ' # Not always good to add a space, but it's their fault!
+                lastText =  '\\' + USFMMarker + ' ' + text
+                #print( "{} {} {} Now have {}:{!r}".format( BBB, C, V, lastMarker, lastText ) )
+            else: # the line begins with an unknown USFM Marker
+                try: status = element.attrib['status']
+                except KeyError: status = None
+                text = element.text
+                noteLineStartProblem( logging.error, _("Found '\\{}' unknown USFM Marker").format( USFMMarker ), text )
+                addPriorityError( 100, C, V, _("Found \\{} unknown USFM Marker on new line in file").format( USFMMarker ) )
+                if status == 'unknown': # USX exporter already knew it was a bad marker
+                    pass # Just drop it completely
+                else:
+                    for prefixLength in range( min( len(USFMMarker), newlineMarkersMaxLength ), 0, -1 ): # Try to do something intelligent here -- it might be just a missing space
+                        tryMarker = USFMMarker[:prefixLength] # Longest first
+                        if tryMarker in newlineMarkersSet: # Let's try changing it
+                            if lastMarker: addLine( lastMarker, lastText )
+                            lastMarker, lastText = tryMarker, USFMMarker[len(tryMarker):] + ' ' + text
+                            loadErrors.append( _("{} {}:{} Changed '\\{}' unknown USFM Marker to {!r} at beginning of line: {}").format( BBB, C, V, USFMMarker, tryMarker, text ) )
+                            logging.warning( _("Changed '\\{}' unknown USFM Marker to {!r} after {} {}:{} at beginning of line: {}").format( USFMMarker, tryMarker, BBB, C, V, text ) )
+                            break
+                # Otherwise, don't bother processing this line -- it'll just cause more problems later on
+        # end of loadParaField
+
+
+        def loadTableField( element, location ):
+            """
+            Load a table from the USX XML.
+            """
+            checkXMLNoAttributes( element, location, 'TT33' )
+            checkXMLNoText( element, location, 'TT42' )
+            checkXMLNoTail( element, location, 'TT88' )
+            for subelement in element:
+                sublocation = subelement.tag + " in " + location
+                #print( "here1", sublocation )
+                checkXMLNoText( subelement, sublocation, 'GR12' )
+                checkXMLNoTail( subelement, sublocation, 'JG78' )
+                assert subelement.tag == 'row'
+                # Process the attribute
+                rowStyle = subelement.get( 'style' )
+                if not ROW_ATTRIBUTE_NAMES.issuperset( subelement.attrib ):
+                    reportUnknownAttributes( subelement.attrib, ROW_ATTRIBUTE_NAMES, logging.error, _("LK46 Unprocessed {} attribute ({}) in {}"), sublocation )
+                assert rowStyle == 'tr'
+                tableCode = ''
+                for sub2element in subelement:
+                    sub2location = sub2element.tag + " in " + sublocation
+                    #print( "  here2", sub2location )
+                    checkXMLNoTail( sub2element, sub2location, 'TY45' )
+                    assert sub2element.tag == 'cell'
+                    # Process the attribute
+                    cellStyle, alignMode = sub2element.get( 'style' ), sub2element.get( 'align' )
+                    if not CELL_ATTRIBUTE_NAMES.issuperset( sub2element.attrib ):
+                        reportUnknownAttributes( sub2element.attrib, CELL_ATTRIBUTE_NAMES, logging.error, _("LP16 Unprocessed {} attribute ({}) in {}"), sub2location )
+                    #print( "cS", cellStyle, "aM", alignMode )
+                    if strictCheckingFlag:
+                        assert cellStyle in ('th1','th2','th3','th4', 'thr1','thr2','thr3','thr4', 'tc1','tc2','tc3','tc4', 'tcr1','tcr2','tcr3','tcr4')
+                        assert alignMode in (None, 'start', 'end')
+                    tableCode += '\\{} {}'.format( cellStyle,
+                                    sub2element.text if not isBlank(sub2element.text) else '' )
+                    assert '\n' not in tableCode
+                    for sub3element in sub2element:
+                        sub3location = sub3element.tag + " in " + sub2location
+                        #print( "    here3", sub3location )
+                        checkXMLNoText( sub3element, sub3location, 'TY47' )
+                        if sub3element.tag == 'note':
+                            #print( "NOTE", BibleOrgSysGlobals.elementStr( sub3element ) )
+                            processedNoteField = loadNoteField( sub3element, sub3location )
+                            if strictCheckingFlag: assert '\n' not in processedNoteField
+                            tableCode += processedNoteField
+                            #for sub4element in sub3element:
+                                #sub4location = sub4element.tag + " in " + sub3location
+                                ##print( "    here4", sub4location )
+                                #checkXMLNoTail( sub4element, sub4location, 'TZ49' )
+                                #if sub4element.tag == 'char':
+                                    #tableCode += loadCharField( sub4element, sub4location )
+                                #else:
+                                    #logging.error( _("KA28 Unprocessed {} sub4element after {} {}:{} in {}").format( sub3element.tag, BBB, C, V, sub4location ) )
+                                    #addPriorityError( 1, C, V, _("Unprocessed {} sub4element").format( sub4element.tag ) )
+                                    #if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+                            #if not isBlank( sub3element.tail ):
+                                #tableCode += sub3element.tail
+                        elif sub3element.tag == 'verse':
+                            loadVerseNumberField( sub3element, sub3location )
+                        else:
+                            logging.error( _("KA29 Unprocessed {} sub3element after {} {}:{} in {}").format( sub3element.tag, BBB, C, V, sub3location ) )
+                            addPriorityError( 1, C, V, _("Unprocessed {} sub3element").format( sub3element.tag ) )
+                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+                        assert '\n' not in tableCode
+                assert '\n' not in tableCode
+                #print( "tableCode: {}".format( tableCode ) )
+                addLine( 'tr', tableCode )
+        # end of loadTableField
+
+
+        topLevelFieldLoaders = { # What to do with each element found at the top level of the USX file
+            'book':loadBookField, 'chapter':loadChapterField,
+            'verse':loadVerseNumberField, # milestone (not a container in USX) -- not in a paragraph!
+            'para':loadParaField, 'table':loadTableField }
+
+
+        def iterTopLevelElements():
+            """
+            Parse the USX XML file incrementally rather than building the entire tree first.
+
+            Yields the root element (once its text is known),
+                and then each top-level element once it's complete (including its tail).
+            Each top-level element is removed from the root again after it's been processed
+                so that we never hold the entire book in memory.
+
+            If the XML turns out to be malformed, any lines already loaded from it are discarded again
+                (so that a truncated book doesn't look like it loaded successfully).
+            """
+            depth, rootElement, lastElement = 0, None, None
+            firstLineIndex = len( self._rawLines )
+            try:
+                for event, element in iterparse( self.sourceFilepath, events=('start','end') ):
+                    if event == 'start':
+                        depth += 1
+                        if depth == 1: rootElement = element
+                        elif depth == 2: # the previous top-level element (and its tail) must be complete now
+                            if lastElement is None: yield rootElement
+                            else:
+                                yield lastElement
+                                del rootElement[0] # Finished with it now
+                            lastElement = element
+                    else: # end event
+                        depth -= 1
+                        if depth == 0: # end of the root element
+                            if lastElement is None: yield rootElement
+                            else:
+                                yield lastElement
+                                del rootElement[0]
+            except ParseError as err:
+                errorString = exp("Loader parse error in xml file {}: {} {}").format( filename, sys.exc_info()[0], err )
+                logging.critical( errorString )
+                del self._rawLines[firstLineIndex:] # Don't keep part of a book
+                loadErrors.append( errorString )
+                addPriorityError( 100, C, V, _("Loader parse error in xml file {}: {}").format( filename, err ) )
+        # end of iterTopLevelElements
+
+
         # Main code for load()
-        lastMarker = None
+        lastMarker = lastText = None
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "  " + _("Loading {} from {}…").format( filename, folder ) )
         elif BibleOrgSysGlobals.verbosityLevel > 2: print( "  " + _("Loading {}…").format( filename ) )
-        self.isOneChapterBook = self.BBB in BibleOrgSysGlobals.BibleBooksCodes.getSingleChapterBooksList()
+        self.isOneChapterBook = BBB in singleChapterBooksSet
         self.sourceFilename = filename
         self.sourceFolder = folder
         self.sourceFilepath = os.path.join( folder, filename ) if folder else filename
-        try: self.tree = ElementTree().parse( self.sourceFilepath )
-        except ParseError as err:
-            logging.critical( exp("Loader parse error in xml file {}: {} {}").format( filename, sys.exc_info()[0], err ) )
-            loadErrors.append( exp("Loader parse error in xml file {}: {} {}").format( filename, sys.exc_info()[0], err ) )
-            self.addPriorityError( 100, C, V, _("Loader parse error in xml file {}: {}").format( filename, err ) )
+        topLevelElements = iterTopLevelElements()
+        rootElement = next( topLevelElements, None ) # Reads up to the first top-level element
         if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and debuggingThisModule:
-            assert len( self.tree ) # Fail here if we didn't load anything at all
+            assert rootElement is not None and len( rootElement ) # Fail here if we didn't load anything at all
 
         # Find the main container
-        if 'tree' in dir(self) \
-        and ( self.tree.tag=='usx' or self.tree.tag=='usfm' ): # Not sure why both are allowable
-            treeLocation = "USX ({}) file".format( self.tree.tag )
-            BibleOrgSysGlobals.checkXMLNoText( self.tree, treeLocation )
-            BibleOrgSysGlobals.checkXMLNoTail( self.tree, treeLocation )
+        if rootElement is not None \
+        and ( rootElement.tag=='usx' or rootElement.tag=='usfm' ): # Not sure why both are allowable
+            treeLocation = "USX ({}) file".format( rootElement.tag )
+            checkXMLNoText( rootElement, treeLocation )
+            checkXMLNoTail( rootElement, treeLocation )
 
             # Process the attributes first
             self.schemaLocation = ''
-            version = None
-            for attrib,value in self.tree.items():
-                if attrib=='version': version = value
-                else:
-                    logging.warning( _("DG84 Unprocessed {} attribute ({}) in {}").format( attrib, value, treeLocation ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            version = rootElement.get( 'version' )
+            if not ROOT_ATTRIBUTE_NAMES.issuperset( rootElement.attrib ):
+                reportUnknownAttributes( rootElement.attrib, ROOT_ATTRIBUTE_NAMES, logging.warning, _("DG84 Unprocessed {} attribute ({}) in {}"), treeLocation )
             if version not in ( None, '2.0','2.5','2.6', ):
                 logging.warning( _("Not sure if we can handle v{} USX files").format( version ) )
                 if debuggingThisModule: halt
 
             # Now process the data
-            for element in self.tree:
-                location = element.tag + " " + treeLocation
-                if element.tag == 'book': # milestone (not a container)
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    BibleOrgSysGlobals.checkXMLNoTail( element, location )
-                    # Process the attributes
-                    idField = bookStyle = None
-                    for attrib,value in element.items():
-                        if attrib=='id' or attrib=='code':
-                            idField = value # Should be USFM bookcode (not like BBB which is BibleOrgSys BBB bookcode)
-                            #if idField != BBB:
-                            #    logging.warning( _("Unexpected book code ({}) in {}").format( idField, location ) )
-                        elif attrib=='style':
-                            bookStyle = value
-                        else:
-                            logging.warning( _("MD12 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    if bookStyle != 'id':
-                        logging.warning( _("Unexpected style attribute ({}) in {}").format( bookStyle, location ) )
-                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    idLine = idField
-                    if element.text and element.text.strip(): idLine += ' ' + element.text
-                    self.addLine( 'id', idLine )
-                elif element.tag == 'chapter': # milestone (not a container)
-                    V = '0'
-                    BibleOrgSysGlobals.checkXMLNoText( element, location )
-                    BibleOrgSysGlobals.checkXMLNoTail( element, location )
-                    BibleOrgSysGlobals.checkXMLNoSubelements( element, location )
-                    # Process the attributes
-                    chapterStyle = pubNumber = None
-                    for attrib,value in element.items():
-                        if attrib=='number': C = value
-                        elif attrib=='style': chapterStyle = value
-                        elif attrib=='pubnumber': pubNumber = value
-                        else:
-                            logging.error( _("LY76 Unprocessed {} attribute ({}) in {}").format( attrib, value, location ) )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    if chapterStyle != 'c':
-                        logging.warning( _("Unexpected style attribute ({}) in {}").format( chapterStyle, location ) )
-                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                    #if pubNumber: print( self.BBB, C, repr(pubNumber) ); halt
-                    self.addLine( 'c', C )
-                    if pubNumber: self.addLine( 'cp', pubNumber )
-                elif element.tag == 'verse': # milestone (not a container in USX)
-                    loadVerseNumberField( element, location ) # Not in a paragraph!
-                elif element.tag == 'para':
-                    BibleOrgSysGlobals.checkXMLNoTail( element, location )
-                    USFMMarker = element.attrib['style'] # Get the USFM code for the paragraph style
-                    if BibleOrgSysGlobals.USFMMarkers.isNewlineMarker( USFMMarker ):
-                        #if lastMarker: self.addLine( lastMarker, lastText )
-                        #lastMarker, lastText = USFMMarker, text
-                        loadParagraph( element, location )
-                    elif BibleOrgSysGlobals.USFMMarkers.isInternalMarker( USFMMarker ): # the line begins with an internal USFM Marker -- append it to the previous line
-                        text = element.text
-                        if text is None: text = ''
-                        if BibleOrgSysGlobals.debugFlag:
-                            print( _("{} {}:{} Found '\\{}' internal USFM marker at beginning of line with text: {}").format( self.BBB, C, V, USFMMarker, text ) )
-                            #halt # Not checked yet
-                        if text:
-                            loadErrors.append( _("{} {}:{} Found '\\{}' internal USFM marker at beginning of line with text: {}").format( self.BBB, C, V, USFMMarker, text ) )
-                            logging.warning( _("Found '\\{}' internal USFM Marker after {} {}:{} at beginning of line with text: {}").format( USFMMarker, self.BBB, C, V, text ) )
-                        else: # no text
-                            loadErrors.append( _("{} {}:{} Found '\\{}' internal USFM Marker at beginning of line (with no text)").format( self.BBB, C, V, USFMMarker ) )
-                            logging.warning( _("Found '\\{}' internal USFM Marker after {} {}:{} at beginning of line (with no text)").format( USFMMarker, self.BBB, C, V ) )
-                        self.addPriorityError( 97, C, V, _("Found \\{} internal USFM Marker on new line in file").format( USFMMarker ) )
-                        #lastText += '' if lastText.endswith(' ') else ' ' # Not always good to add a space, but it's their fault!
-                        lastText =  '\\' + USFMMarker + ' ' + text
-                        #print( "{} {} {} Now have {}:{!r}".format( self.BBB, C, V, lastMarker, lastText ) )
-                    else: # the line begins with an unknown USFM Marker
-                        try: status = element.attrib['status']
-                        except KeyError: status = None
-                        text = element.text
-                        if text:
-                            loadErrors.append( _("{} {}:{} Found '\\{}' unknown USFM Marker at beginning of line with text: {}").format( self.BBB, C, V, USFMMarker, text ) )
-                            logging.error( _("Found '\\{}' unknown USFM Marker after {} {}:{} at beginning of line with text: {}").format( USFMMarker, self.BBB, C, V, text ) )
-                        else: # no text
-                            loadErrors.append( _("{} {}:{} Found '\\{}' unknown USFM Marker at beginning of line (with no text").format( self.BBB, C, V, USFMMarker ) )
-                            logging.error( _("Found '\\{}' unknown USFM Marker after {} {}:{} at beginning of line (with no text)").format( USFMMarker, self.BBB, C, V ) )
-                        self.addPriorityError( 100, C, V, _("Found \\{} unknown USFM Marker on new line in file").format( USFMMarker ) )
-                        if status == 'unknown': # USX exporter already knew it was a bad marker
-                            pass # Just drop it completely
-                        else:
-                            for tryMarker in sortedNLMarkers: # Try to do something intelligent here -- it might be just a missing space
-                                if USFMMarker.startswith( tryMarker ): # Let's try changing it
-                                    if lastMarker: self.addLine( lastMarker, lastText )
-                                    lastMarker, lastText = tryMarker, USFMMarker[len(tryMarker):] + ' ' + text
-                                    loadErrors.append( _("{} {}:{} Changed '\\{}' unknown USFM Marker to {!r} at beginning of line: {}").format( self.BBB, C, V, USFMMarker, tryMarker, text ) )
-                                    logging.warning( _("Changed '\\{}' unknown USFM Marker to {!r} after {} {}:{} at beginning of line: {}").format( USFMMarker, tryMarker, self.BBB, C, V, text ) )
-                                    break
-                        # Otherwise, don't bother processing this line -- it'll just cause more problems later on
-                elif element.tag == 'table':
-                    BibleOrgSysGlobals.checkXMLNoAttributes( element, location, 'TT33' )
-                    BibleOrgSysGlobals.checkXMLNoText( element, location, 'TT42' )
-                    BibleOrgSysGlobals.checkXMLNoTail( element, location, 'TT88' )
-                    for subelement in element:
-                        sublocation = subelement.tag + " in " + location
-                        #print( "here1", sublocation )
-                        BibleOrgSysGlobals.checkXMLNoText( subelement, sublocation, 'GR12' )
-                        BibleOrgSysGlobals.checkXMLNoTail( subelement, sublocation, 'JG78' )
-                        assert subelement.tag == 'row'
-                        # Process the attribute
-                        rowStyle = None
-                        for attrib,value in subelement.items():
-                            if attrib=='style': rowStyle = value
-                            else:
-                                logging.error( _("LK46 Unprocessed {} attribute ({}) in {}").format( attrib, value, sublocation ) )
-                                if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                        assert rowStyle == 'tr'
-                        tableCode = ''
-                        for sub2element in subelement:
-                            sub2location = sub2element.tag + " in " + sublocation
-                            #print( "  here2", sub2location )
-                            BibleOrgSysGlobals.checkXMLNoTail( sub2element, sub2location, 'TY45' )
-                            assert sub2element.tag == 'cell'
-                            # Process the attribute
-                            cellStyle = alignMode = None
-                            for attrib,value in sub2element.items():
-                                if attrib=='style': cellStyle = value
-                                elif attrib=='align': alignMode = value
-                                else:
-                                    logging.error( _("LP16 Unprocessed {} attribute ({}) in {}").format( attrib, value, sub2location ) )
-                                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                            #print( "cS", cellStyle, "aM", alignMode )
-                            if BibleOrgSysGlobals.strictCheckingFlag:
-                                assert cellStyle in ('th1','th2','th3','th4', 'thr1','thr2','thr3','thr4', 'tc1','tc2','tc3','tc4', 'tcr1','tcr2','tcr3','tcr4')
-                                assert alignMode in (None, 'start', 'end')
-                            tableCode += '\\{} {}'.format( cellStyle,
-                                            sub2element.text if not BibleOrgSysGlobals.isBlank(sub2element.text) else '' )
-                            assert '\n' not in tableCode
-                            for sub3element in sub2element:
-                                sub3location = sub3element.tag + " in " + sub2location
-                                #print( "    here3", sub3location )
-                                BibleOrgSysGlobals.checkXMLNoText( sub3element, sub3location, 'TY47' )
-                                if sub3element.tag == 'note':
-                                    #print( "NOTE", BibleOrgSysGlobals.elementStr( sub3element ) )
-                                    processedNoteField = loadNoteField( sub3element, sub3location )
-                                    if BibleOrgSysGlobals.strictCheckingFlag: assert '\n' not in processedNoteField
-                                    tableCode += processedNoteField
-                                    #for sub4element in sub3element:
-                                        #sub4location = sub4element.tag + " in " + sub3location
-                                        ##print( "    here4", sub4location )
-                                        #BibleOrgSysGlobals.checkXMLNoTail( sub4element, sub4location, 'TZ49' )
-                                        #if sub4element.tag == 'char':
-                                            #tableCode += loadCharField( sub4element, sub4location )
-                                        #else:
-                                            #logging.error( _("KA28 Unprocessed {} sub4element after {} {}:{} in {}").format( sub3element.tag, self.BBB, C, V, sub4location ) )
-                                            #self.addPriorityError( 1, C, V, _("Unprocessed {} sub4element").format( sub4element.tag ) )
-                                            #if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                                    #if not BibleOrgSysGlobals.isBlank( sub3element.tail ):
-                                        #tableCode += sub3element.tail
-                                elif sub3element.tag == 'verse':
-                                    loadVerseNumberField( sub3element, sub3location )
-                                else:
-                                    logging.error( _("KA29 Unprocessed {} sub3element after {} {}:{} in {}").format( sub3element.tag, self.BBB, C, V, sub3location ) )
-                                    self.addPriorityError( 1, C, V, _("Unprocessed {} sub3element").format( sub3element.tag ) )
-                                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                                assert '\n' not in tableCode
-                        assert '\n' not in tableCode
-                        #print( "tableCode: {}".format( tableCode ) )
-                        self.addLine( 'tr', tableCode )
+            for element in topLevelElements:
+                tag = element.tag
+                location = tag + " " + treeLocation
+                loader = topLevelFieldLoaders.get( tag )
+                if loader is not None: loader( element, location )
                 else:
-                    logging.error( _("DV60 Unprocessed {} element after {} {}:{} in {}").format( element.tag, self.BBB, C, V, location ) )
-                    self.addPriorityError( 1, C, V, _("Unprocessed {} element").format( element.tag ) )
+                    logging.error( _("DV60 Unprocessed {} element after {} {}:{} in {}").format( tag, BBB, C, V, location ) )
+                    addPriorityError( 1, C, V, _("Unprocessed {} element").format( tag ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
 
         if loadErrors: self.errorDictionary['Load Errors'] = loadErrors
@@ -636,6 +775,22 @@ class USXXMLBibleBook( BibleBook ):
 
 
 
+def demoLoadBook( parameters ):
+    """
+    Load and validate a single USX book for the demo.
+
+    Used for multiprocessing (so must be at module level).
+    """
+    name, BBB, filename, folder = parameters
+    if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Loading USX {} from {}…").format( BBB, filename ) )
+    UxBB = USXXMLBibleBook( name, BBB )
+    UxBB.load( filename, folder )
+    UxBB.validateMarkers()
+    return UxBB
+# end of demoLoadBook
+
+
+
 def demo():
     """
     Main program to handle command line parameters and then run what they want.
@@ -648,6 +803,7 @@ def demo():
         return someString[:int(maxLen/2)]+'…'+someString[-int(maxLen/2):]
 
     import USXFilenames, USFMFilenames, USFMBibleBook
+    from itertools import zip_longest
     #name, testFolder = "Matigsalug", "../../../../../Data/Work/VirtualBox_Shared_Folder/PT7.3 Exports/USXExports/Projects/MBTV/" # You can put your USX test folder here
     #name, testFolder = "Matigsalug", "../../../../../Data/Work/VirtualBox_Shared_Folder/PT7.4 Exports/USX Exports/MBTV/" # You can put your USX test folder here
     name, testFolder = "Matigsalug", "../../../../../Data/Work/VirtualBox_Shared_Folder/PT7.5 Exports/USX/MBTV/" # You can put your USX test folder here
@@ -656,6 +812,7 @@ def demo():
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Scanning USX  {} from {}…").format( name, testFolder ) )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Scanning USFM {} from {}…").format( name, testFolder2 ) )
         fileList = USXFilenames.USXFilenames( testFolder ).getConfirmedFilenameTuples()
+        parameters = []
         for BBB,filename in fileList:
             if BBB in (
                      'GEN',
@@ -665,86 +822,102 @@ def demo():
                     'ROM','CO1','CO2','GAL','EPH','PHP','COL','TH1','TH2','TI1','TI2','TIT','PHM',
                     'HEB','JAM','PE1','PE2','JN1','JN2','JN3','JDE','REV'
                     ):
-                if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Loading USX {} from {}…").format( BBB, filename ) )
-                UxBB = USXXMLBibleBook( name, BBB )
-                UxBB.load( filename, testFolder )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "  ID is {!r}".format( UxBB.getField( 'id' ) ) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Header is {!r}".format( UxBB.getField( 'h' ) ) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Main titles are {!r} and {!r}".format( UxBB.getField( 'mt1' ), UxBB.getField( 'mt2' ) ) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBB )
-                UxBB.validateMarkers()
-                UxBBVersification = UxBB.getVersification ()
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBVersification )
-                UxBBAddedUnits = UxBB.getAddedUnits ()
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBAddedUnits )
-                UxBB.check()
-                UxBBErrors = UxBB.getErrors()
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBErrors )
-
-                # Test our USX code by comparing with the original USFM books
-                if os.access( testFolder2, os.R_OK ):
-                    fileList2 = USFMFilenames.USFMFilenames( testFolder2 ).getConfirmedFilenameTuples()
-                    found2 = False
-                    for BBB2,filename2 in fileList2:
-                        if BBB2 == BBB:
-                            found2 = True; break
-                    if found2:
-                        if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading USFM {} from {}…").format( BBB2, filename2 ) )
-                        UBB = USFMBibleBook.USFMBibleBook( name, BBB )
-                        UBB.load( filename2, testFolder2 )
-                        #print( "  ID is {!r}".format( UBB.getField( 'id' ) ) )
-                        #print( "  Header is {!r}".format( UBB.getField( 'h' ) ) )
-                        #print( "  Main titles are {!r} and {!r}".format( UBB.getField( 'mt1' ), UBB.getField( 'mt2' ) ) )
-                        if BibleOrgSysGlobals.verbosityLevel > 2: print( UBB )
-                        UBB.validateMarkers()
-
-                        # Now compare the USX and USFM projects
-                        if 0:
-                            print( "\nPRINTING COMPARISON" )
-                            ixFrom, ixTo = 8, 40
-                            if ixTo-ixFrom < 10:
-                                print( "UsxBB[{}-{}]".format( ixFrom, ixTo ) )
-                                for ix in range( ixFrom, ixTo ): print( "  {} {}".format( 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UxBB._processedLines[ix] ) )
-                                print( "UsfBB[{}-{}]".format( ixFrom, ixTo ) )
-                                for ix in range( ixFrom, ixTo ): print( "  {} {}".format( 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UBB._processedLines[ix] ) )
-                            else:
-                                for ix in range( ixFrom, ixTo ):
-                                    print( "UsxBB[{}]: {} {}".format( ix, 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UxBB._processedLines[ix] ) )
-                                    print( "UsfBB[{}]: {} {}".format( ix, 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UBB._processedLines[ix] ) )
-                            print( "END COMPARISON\n" )
-
-                        mismatchCount = 0
-                        UxL, UL = len(UxBB), len(UBB)
-                        for i in range(0, max( UxL, UL ) ):
-                            if i<UxL and i<UL:
-                                if UxBB._processedLines[i] != UBB._processedLines[i]:
-                                    print( "\n{} line {} not equal: {}({}) from {}({})".format( BBB, i, UxBB._processedLines[i].getCleanText(), UxBB._processedLines[i].getMarker(), UBB._processedLines[i].getCleanText(), UBB._processedLines[i].getMarker() ) )
-                                    if 1:
-                                        print( "usx ", repr(UxBB._processedLines[i]) )
-                                        print( "usx ", i, len(UxBB._processedLines[i]), UxBB._processedLines[i].getMarker(), UxBB._processedLines[i].getOriginalText() )
-                                        print( "usfm", repr(UBB._processedLines[i]) )
-                                        print( "usfm", i, len(UBB._processedLines[i]), UBB._processedLines[i].getMarker() )
-                                    if UxBB._processedLines[i].getAdjustedText() != UBB._processedLines[i].getAdjustedText():
-                                        print( "   UsxBB[adj]: {!r}".format( getShortVersion( UxBB._processedLines[i].getAdjustedText() ) ) )
-                                        print( "   UsfBB[adj]: {!r}".format( getShortVersion( UBB._processedLines[i].getAdjustedText() ) ) )
-                                    if (UxBB._processedLines[i].getCleanText() or UBB._processedLines[i].getCleanText()) and UxBB._processedLines[i].getCleanText()!=UBB._processedLines[i].getCleanText():
-                                        print( "   UdsBB[clT]: {!r}".format( getShortVersion( UxBB._processedLines[i].getCleanText() ) ) )
-                                        print( "   UsfBB[clT]: {!r}".format( getShortVersion( UBB._processedLines[i].getCleanText() ) ) )
-                                    mismatchCount += 1
-                            else: # one has more lines
-                                print( "Linecount not equal: {} from {}".format( i, UxL, UL ) )
-                                mismatchCount += 1
-                                break
-                            if mismatchCount > 5: print( "…" ); break
-                        if mismatchCount == 0 and BibleOrgSysGlobals.verbosityLevel > 2:
-                            print( "All {} processedLines matched!".format( UxL ) )
-                    else: print( "Sorry, USFM test folder doesn't contain the {} book.".format( BBB ) )
-                else: print( "Sorry, USFM test folder {!r} doesn't exist on this computer.".format( testFolder2 ) )
+                parameters.append( (name, BBB, filename, testFolder) )
             elif BibleOrgSysGlobals.verbosityLevel > 2: print( "*** Skipped USX/USFM compare on {}", BBB )
+
+        # The books don't depend on each other, so load them all first (in parallel if we can)
+        if BibleOrgSysGlobals.maxProcesses > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing: # Get our subprocesses ready and waiting for work
+            if BibleOrgSysGlobals.verbosityLevel > 1:
+                print( _("Loading {} {} books using {} CPUs…").format( len(parameters), 'USX', BibleOrgSysGlobals.maxProcesses ) )
+                print( _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
+            BibleOrgSysGlobals.alreadyMultiprocessing = True
+            try:
+                with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+                    results = pool.map( demoLoadBook, parameters ) # have the pool do our loads
+            finally: BibleOrgSysGlobals.alreadyMultiprocessing = False # even if a load failed
+        else: # Just single threaded
+            results = [demoLoadBook( parameter ) for parameter in parameters]
+
+        # Now check them and compare them with the USFM books (one by one)
+        for j, UxBB in enumerate( results ):
+            BBB = parameters[j][1]
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "  ID is {!r}".format( UxBB.getField( 'id' ) ) )
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Header is {!r}".format( UxBB.getField( 'h' ) ) )
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Main titles are {!r} and {!r}".format( UxBB.getField( 'mt1' ), UxBB.getField( 'mt2' ) ) )
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBB )
+            UxBBVersification = UxBB.getVersification ()
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBVersification )
+            UxBBAddedUnits = UxBB.getAddedUnits ()
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBAddedUnits )
+            UxBB.check()
+            UxBBErrors = UxBB.getErrors()
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( UxBBErrors )
+
+            # Test our USX code by comparing with the original USFM books
+            if os.access( testFolder2, os.R_OK ):
+                fileList2 = USFMFilenames.USFMFilenames( testFolder2 ).getConfirmedFilenameTuples()
+                found2 = False
+                for BBB2,filename2 in fileList2:
+                    if BBB2 == BBB:
+                        found2 = True; break
+                if found2:
+                    if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading USFM {} from {}…").format( BBB2, filename2 ) )
+                    UBB = USFMBibleBook.USFMBibleBook( name, BBB )
+                    UBB.load( filename2, testFolder2 )
+                    #print( "  ID is {!r}".format( UBB.getField( 'id' ) ) )
+                    #print( "  Header is {!r}".format( UBB.getField( 'h' ) ) )
+                    #print( "  Main titles are {!r} and {!r}".format( UBB.getField( 'mt1' ), UBB.getField( 'mt2' ) ) )
+                    if BibleOrgSysGlobals.verbosityLevel > 2: print( UBB )
+                    UBB.validateMarkers()
+
+                    # Now compare the USX and USFM projects
+                    if 0:
+                        print( "\nPRINTING COMPARISON" )
+                        ixFrom, ixTo = 8, 40
+                        if ixTo-ixFrom < 10:
+                            print( "UsxBB[{}-{}]".format( ixFrom, ixTo ) )
+                            for ix in range( ixFrom, ixTo ): print( "  {} {}".format( 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UxBB._processedLines[ix] ) )
+                            print( "UsfBB[{}-{}]".format( ixFrom, ixTo ) )
+                            for ix in range( ixFrom, ixTo ): print( "  {} {}".format( 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UBB._processedLines[ix] ) )
+                        else:
+                            for ix in range( ixFrom, ixTo ):
+                                print( "UsxBB[{}]: {} {}".format( ix, 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UxBB._processedLines[ix] ) )
+                                print( "UsfBB[{}]: {} {}".format( ix, 'GUD' if UxBB._processedLines[ix]==UBB._processedLines[ix] else 'BAD', UBB._processedLines[ix] ) )
+                        print( "END COMPARISON\n" )
+
+                    mismatchCount = 0
+                    UxL, UL = len(UxBB), len(UBB)
+                    for i, (UxEntry, UEntry) in enumerate( zip_longest( UxBB._processedLines, UBB._processedLines ) ):
+                        if UxEntry is None or UEntry is None: # one has more lines
+                            print( "Linecount not equal: {} from {}".format( i, UxL, UL ) )
+                            mismatchCount += 1
+                            break
+                        if UxEntry != UEntry:
+                            print( "\n{} line {} not equal: {}({}) from {}({})".format( BBB, i, UxEntry.getCleanText(), UxEntry.getMarker(), UEntry.getCleanText(), UEntry.getMarker() ) )
+                            if 1:
+                                print( "usx ", repr(UxEntry) )
+                                print( "usx ", i, len(UxEntry), UxEntry.getMarker(), UxEntry.getOriginalText() )
+                                print( "usfm", repr(UEntry) )
+                                print( "usfm", i, len(UEntry), UEntry.getMarker() )
+                            if UxEntry.getAdjustedText() != UEntry.getAdjustedText():
+                                print( "   UsxBB[adj]: {!r}".format( getShortVersion( UxEntry.getAdjustedText() ) ) )
+                                print( "   UsfBB[adj]: {!r}".format( getShortVersion( UEntry.getAdjustedText() ) ) )
+                            if (UxEntry.getCleanText() or UEntry.getCleanText()) and UxEntry.getCleanText()!=UEntry.getCleanText():
+                                print( "   UdsBB[clT]: {!r}".format( getShortVersion( UxEntry.getCleanText() ) ) )
+                                print( "   UsfBB[clT]: {!r}".format( getShortVersion( UEntry.getCleanText() ) ) )
+                            mismatchCount += 1
+                        if mismatchCount > 5: print( "…" ); break
+                    if mismatchCount == 0 and BibleOrgSysGlobals.verbosityLevel > 2:
+                        print( "All {} processedLines matched!".format( UxL ) )
+                else: print( "Sorry, USFM test folder doesn't contain the {} book.".format( BBB ) )
+            else: print( "Sorry, USFM test folder {!r} doesn't exist on this computer.".format( testFolder2 ) )
     else: print( "Sorry, USX test folder {!r} doesn't exist on this computer.".format( testFolder ) )
 # end of demo
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support() # Multiprocessing support for frozen Windows executables
+
     if 'win' in sys.platform: # Convert stdout so we don't get zillions of UnicodeEncodeErrors
         from io import TextIOWrapper
         sys.stdout = TextIOWrapper( sys.stdout.detach(), sys.stdout.encoding, 'namereplace' if sys.version_info >= (3,5) else 'backslashreplace' )